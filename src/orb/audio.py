@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import json
 import logging
+import math
 import os
+import queue
+import select
 import socket
 import subprocess
 import tempfile
@@ -11,8 +13,76 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
-import sounddevice as sd
-import soundfile as sf
+
+
+_RMS_WINDOWS_PER_READ = 16
+# Captured blocks are buffered and handed to libsndfile this many at a time.
+_RECORD_FLUSH_BLOCKS = 8
+# Preallocated input blocks shared between the PortAudio callback and the recorder.
+_CAPTURE_SLOTS = 8
+_CAPTURE_STALL_TIMEOUT_S = 2.0
+# Volume changes are sent dozens of times per fade; format them directly instead of json.dumps.
+_VOLUME_COMMAND_TEMPLATE = b'{"command": ["set_property", "volume", %d]}\n'
+# Fade ticks shorter than this are coalesced so short fade intervals don't flood mpv with IPC writes.
+_MIN_FADE_TICK_S = 0.02
+
+
+def _downmix(data: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Downmix a ``(frames, channels)`` block to mono.
+
+    Single-channel input is returned as a view of ``data``; multichannel input is
+    summed into ``out`` so callers can reuse one buffer instead of allocating per block.
+    """
+    channels = data.shape[1]
+    if channels == 1:
+        return data[:, 0]
+    mono = np.add.reduce(data, axis=1, out=out[: len(data)])
+    mono *= np.float32(1.0 / channels)
+    return mono
+
+
+def _downmix_energy(data: np.ndarray, out: np.ndarray) -> tuple[np.ndarray, float]:
+    """Downmix like :func:`_downmix` and return ``(mono, mean_square)``.
+
+    The sum of squares is one dot product; callers take the square root only when
+    they need an RMS value rather than a comparison against a squared threshold.
+    """
+    mono = _downmix(data, out)
+    return mono, float(np.dot(mono, mono)) / len(mono)
+
+
+class _CaptureBuffers:
+    """Fixed pool of input blocks filled by the PortAudio callback and consumed in order.
+
+    The callback copies each block into the next free slot and queues its index, so
+    steady-state capture allocates no arrays. At most ``slots - 2`` blocks wait in the
+    queue: together with the block the consumer is processing and the slot being
+    written, no slot is overwritten while in use. When the consumer falls that far
+    behind, new blocks are dropped and counted instead.
+    """
+
+    def __init__(self, blocksize: int, channels: int, slots: int = _CAPTURE_SLOTS) -> None:
+        self._blocks = np.empty((slots, blocksize, channels), dtype=np.float32)
+        self._ready: queue.Queue[tuple[int, int]] = queue.Queue(maxsize=slots - 2)
+        self._next_slot = 0
+        self.dropped = 0
+
+    def callback(self, indata: np.ndarray, frames: int, _time: object, _status: object) -> None:
+        slot = self._next_slot
+        self._blocks[slot, :frames] = indata
+        try:
+            self._ready.put_nowait((slot, frames))
+        except queue.Full:
+            self.dropped += 1
+            return
+        self._next_slot = (slot + 1) % len(self._blocks)
+
+    def next_block(self) -> np.ndarray:
+        try:
+            slot, frames = self._ready.get(timeout=_CAPTURE_STALL_TIMEOUT_S)
+        except queue.Empty as exc:
+            raise RuntimeError("Audio capture stalled: no input received") from exc
+        return self._blocks[slot, :frames]
 
 
 @dataclass
@@ -36,17 +106,19 @@ class AmbientPlayer:
         self.fade_step = max(1, fade_step)
         self.fade_interval = fade_interval
         self.proc: subprocess.Popen[str] | None = None
+        self._sock: socket.socket | None = None
         self._ipc_failure_log_window_s = 5.0
-        self._last_ipc_failure_log_at = 0.0
+        self._last_ipc_failure_log_at = -math.inf
         self._last_ipc_error: Exception | None = None
 
     def _log_ipc_failure_once(self, exc: Exception) -> None:
-        now = time.time()
+        now = time.monotonic()
         if now - self._last_ipc_failure_log_at >= self._ipc_failure_log_window_s:
             logging.warning("Ambient IPC unavailable (%s)", exc)
             self._last_ipc_failure_log_at = now
 
     def start(self) -> None:
+        self._close_socket()
         Path(self.socket_path).unlink(missing_ok=True)
 
         cmd = [
@@ -69,6 +141,7 @@ class AmbientPlayer:
                 self.proc.wait(timeout=2.0)
             except subprocess.TimeoutExpired:
                 self.proc.kill()
+        self._close_socket()
         try:
             Path(self.socket_path).unlink(missing_ok=True)
         except OSError as exc:
@@ -78,19 +151,36 @@ class AmbientPlayer:
         target = int(max(0, min(100, target)))
         if target == self.volume:
             return
-        step = self.fade_step if target > self.volume else -self.fade_step
-        for v in range(self.volume, target, step):
-            self._set_volume(v)
-            time.sleep(self.fade_interval)
+        start_volume = self.volume
+        direction = 1 if target > start_volume else -1
+        steps = math.ceil(abs(target - start_volume) / self.fade_step)
+        if self.fade_interval > 0:
+            # The fade keeps its full duration (steps * fade_interval), but the volume is
+            # sampled from the clock on coarser ticks and only sent when it changes.
+            tick = max(self.fade_interval, _MIN_FADE_TICK_S)
+            start = time.monotonic()
+            next_tick = start
+            while True:
+                completed = int((time.monotonic() - start) / self.fade_interval)
+                if completed >= steps:
+                    break
+                vol = start_volume + direction * completed * self.fade_step
+                if vol != self.volume:
+                    self._set_volume(vol)
+                next_tick += tick
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
         self._set_volume(target)
 
     def _set_volume(self, vol: int) -> None:
         vol = int(vol)
-        sent = self._ipc({"command": ["set_property", "volume", vol]})
+        msg = _VOLUME_COMMAND_TEMPLATE % vol
+        sent = self._ipc_bytes(msg)
         if not sent:
             self._log_ipc_failure_once(self._last_ipc_error or ConnectionError("set_property volume failed"))
             if self._attempt_restart():
-                sent = self._ipc({"command": ["set_property", "volume", vol]})
+                sent = self._ipc_bytes(msg)
             if not sent:
                 self._log_ipc_failure_once(self._last_ipc_error or ConnectionError("set_property volume retry failed"))
         self.volume = int(vol)
@@ -108,22 +198,51 @@ class AmbientPlayer:
             self._log_ipc_failure_once(exc)
             return False
 
-    def _ipc(self, payload: dict) -> bool:
-        msg = (json.dumps(payload) + "\n").encode("utf-8")
+    def _ipc_bytes(self, msg: bytes) -> bool:
+        # The connection is kept open across commands; a stale one is replaced once.
+        reused = self._sock is not None
+        for _attempt in range(2 if reused else 1):
+            try:
+                if self._sock is None:
+                    self._sock = self._connect()
+                else:
+                    self._drain_replies()
+                self._sock.sendall(msg)
+                self._last_ipc_error = None
+                return True
+            except (socket.timeout, FileNotFoundError, ConnectionRefusedError, OSError) as exc:
+                self._close_socket()
+                self._last_ipc_error = exc
+        return False
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         try:
-            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
-                s.settimeout(1.0)
-                s.connect(self.socket_path)
-                s.sendall(msg)
-            self._last_ipc_error = None
-            return True
-        except (socket.timeout, FileNotFoundError, ConnectionRefusedError, OSError) as exc:
-            self._last_ipc_error = exc
-            return False
+            sock.settimeout(1.0)
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _drain_replies(self) -> None:
+        """Discard mpv's command replies so they never fill the socket receive buffer."""
+        assert self._sock is not None
+        while select.select([self._sock], [], [], 0)[0]:
+            if not self._sock.recv(65536):
+                raise ConnectionResetError("mpv closed the IPC connection")
+
+    def _close_socket(self) -> None:
+        if self._sock is None:
+            return
+        try:
+            self._sock.close()
+        finally:
+            self._sock = None
 
     def _wait_for_socket(self, timeout_s: float) -> None:
-        end = time.time() + timeout_s
-        while time.time() < end:
+        end = time.monotonic() + timeout_s
+        while time.monotonic() < end:
             if os.path.exists(self.socket_path):
                 return
             time.sleep(0.05)
@@ -146,14 +265,22 @@ class AudioIO:
         max_record_seconds: float,
         threshold_multiplier: float,
     ) -> RecordingResult:
+        # PortAudio and libsndfile are only loaded once something is actually recorded.
+        import sounddevice as sd
+        import soundfile as sf
+
         logging.info("Recording started")
         wav_file = tempfile.NamedTemporaryFile(prefix="orb_record_", suffix=".wav", delete=False)
         wav_path = wav_file.name
         wav_file.close()
 
-        start = time.time()
-        silent_for = 0.0
+        # Silence is tracked as a run of quiet blocks; the run length needed to stop is
+        # fixed for the whole recording, so compare integers instead of summing seconds.
+        silent_blocks = 0
+        silent_blocks_needed = max(1, math.ceil(silence_seconds * self.sample_rate / self.blocksize - 1e-9))
         threshold = None
+        silence_energy = 0.0
+        calibrating = True
         calibrate_seconds = 1.0
         sample_count = 0
 
@@ -165,37 +292,61 @@ class AudioIO:
                 channels=1,
                 subtype="FLOAT",
             ) as out_file:
+                buffers = _CaptureBuffers(self.blocksize, self.channels)
                 with sd.InputStream(
                     samplerate=self.sample_rate,
                     channels=self.channels,
                     dtype="float32",
                     blocksize=self.blocksize,
-                ) as stream:
+                    callback=buffers.callback,
+                ):
+                    # Mono blocks are staged in a ring and written to libsndfile a few
+                    # blocks at a time; multichannel input is downmixed straight into it.
+                    ring = np.empty(self.blocksize * _RECORD_FLUSH_BLOCKS, dtype=np.float32)
+                    ring_offset = 0
+                    copy_mono = self.channels == 1
+                    # Bind per-block lookups once; the loop body runs for every captured block.
+                    next_block = buffers.next_block
+                    write = out_file.write
+                    downmix_energy = _downmix_energy
+                    sqrt = math.sqrt
+                    sample_rate = self.sample_rate
                     while True:
-                        data, _overflowed = stream.read(self.blocksize)
-                        mono = np.mean(data, axis=1).astype(np.float32, copy=False)
-                        out_file.write(mono)
-                        sample_count += len(mono)
-
-                        rms = float(np.sqrt(np.mean(np.square(mono)) + 1e-12))
+                        data = next_block()
+                        frames = len(data)
+                        if ring_offset + frames > len(ring):
+                            write(ring[:ring_offset])
+                            ring_offset = 0
+                        mono, energy = downmix_energy(data, ring[ring_offset:])
+                        if copy_mono:
+                            ring[ring_offset : ring_offset + frames] = mono
+                        ring_offset += frames
+                        sample_count += frames
 
-                        elapsed = time.time() - start
-                        if elapsed <= calibrate_seconds:
+                        elapsed = sample_count / sample_rate
+                        if calibrating and elapsed <= calibrate_seconds:
+                            rms = sqrt(energy + 1e-12)
                             threshold = rms if threshold is None else (0.9 * threshold + 0.1 * rms)
                         else:
-                            assert threshold is not None
-                            silence_threshold = threshold * threshold_multiplier
-                            if rms < silence_threshold:
-                                silent_for += self.blocksize / self.sample_rate
-                            else:
-                                silent_for = 0.0
+                            if calibrating:
+                                # The noise floor is frozen from here on, so scale it once and
+                                # square it: sqrt(energy + 1e-12) < t  <=>  energy < t*t - 1e-12.
+                                assert threshold is not None
+                                silence_threshold = threshold * threshold_multiplier
+                                silence_energy = silence_threshold * silence_threshold - 1e-12
+                                calibrating = False
+                            silent_blocks = silent_blocks + 1 if energy < silence_energy else 0
 
                         if elapsed >= max_record_seconds:
                             logging.info("Stopped recording: max duration reached")
                             break
-                        if elapsed > calibrate_seconds and silent_for >= silence_seconds:
+                        if silent_blocks >= silent_blocks_needed:
                             logging.info("Stopped recording: silence detected")
                             break
+                    if ring_offset:
+                        write(ring[:ring_offset])
+                if buffers.dropped:
+                    logging.warning("Recording dropped %d input blocks (processing fell behind)", buffers.dropped)
         except Exception:
             AudioIO.cleanup_file(wav_path)
             raise
@@ -206,17 +357,28 @@ class AudioIO:
 
     @staticmethod
     def rms_from_audio_file(path: str, sample_count: int = 40) -> list[float]:
-        data, sr = sf.read(path, always_2d=False)
-        if data.ndim > 1:
-            data = np.mean(data, axis=1)
-        window = max(1, len(data) // sample_count)
-        values = []
-        for i in range(0, len(data), window):
-            frame = data[i : i + window]
-            if len(frame) == 0:
+        import soundfile as sf
+
+        window = max(1, sf.info(path).frames // sample_count)
+        # Read several windows per block and reduce them together with reduceat so the
+        # per-window work stays in NumPy while memory is still bounded to one block.
+        blocksize = window * _RMS_WINDOWS_PER_READ
+        mono_buf = np.empty(blocksize, dtype=np.float32)
+        values: list[float] = []
+        for block in sf.blocks(path, blocksize=blocksize, dtype="float32", always_2d=True):
+            if len(block) == 0:
                 continue
-            rms = float(np.sqrt(np.mean(np.square(frame)) + 1e-12))
-            values.append(min(1.0, rms * 8.0))
+            mono = _downmix(block, mono_buf)
+            squared = np.square(mono, out=mono_buf[: len(mono)])
+            starts = np.arange(0, len(squared), window)
+            # Keep the reduction in float32: dividing by the int64 window counts out of
+            # place would promote every window to float64.
+            rms = np.add.reduceat(squared, starts)
+            rms /= np.diff(np.append(starts, len(squared)))
+            rms += 1e-12
+            np.sqrt(rms, out=rms)
+            rms *= 8.0
+            values.extend(np.minimum(rms, 1.0, out=rms).tolist())
         return values or [0.1]
 
     @staticmethod
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import Any, Callable
 
 
 class ConfigError(ValueError):
@@ -23,8 +22,9 @@ class PathConfig:
     ambient_loop: str
     glass_chime: str
     down_chime: str
-    tts_output: str
     mpv_socket: str
+    # Deprecated and unused: replies are streamed to mpv. Still accepted so older configs load.
+    tts_output: str | None = None
 
 
 @dataclass
@@ -125,6 +125,13 @@ class OrbConfig:
             raise ConfigError(f"{key_path} must be > 0")
         return parsed
 
+    @classmethod
+    def _require_int_range(cls, value: Any, key_path: str, min_value: int, max_value: int) -> int:
+        parsed = cls._require_int(value, key_path)
+        if not min_value <= parsed <= max_value:
+            raise ConfigError(f"{key_path} must be between {min_value} and {max_value}")
+        return parsed
+
     @classmethod
     def _require_range(cls, value: Any, key_path: str, min_value: float, max_value: float) -> float:
         parsed = cls._require_float(value, key_path)
@@ -136,21 +143,7 @@ class OrbConfig:
     def from_dict(cls, data: dict[str, Any]) -> "OrbConfig":
         root = cls._require_mapping(data, "config")
 
-        required_top_level = [
-            "stop_keyword",
-            "ambient_volume_normal",
-            "ambient_volume_ducked",
-            "silence_seconds",
-            "max_record_seconds",
-            "gpio_pin_touch",
-            "led_count",
-            "led_pin",
-            "led_brightness",
-            "chat_system_prompt",
-            "models",
-            "paths",
-        ]
-        for key in required_top_level:
+        for key in _REQUIRED_TOP_LEVEL_KEYS:
             cls._require_key(root, key, "config")
 
         models_data = cls._require_mapping(root["models"], "models")
@@ -158,7 +151,7 @@ class OrbConfig:
             cls._require_key(models_data, key, "models")
 
         paths_data = cls._require_mapping(root["paths"], "paths")
-        for key in ("ambient_loop", "glass_chime", "down_chime", "tts_output", "mpv_socket"):
+        for key in ("ambient_loop", "glass_chime", "down_chime", "mpv_socket"):
             cls._require_key(paths_data, key, "paths")
 
         dry_run_data = root.get("dry_run", {})
@@ -181,43 +174,10 @@ class OrbConfig:
             web_data = {}
         web_data = cls._require_mapping(web_data, "web")
 
-        ambient_volume_normal = cls._require_int(root["ambient_volume_normal"], "ambient_volume_normal")
-        if not 0 <= ambient_volume_normal <= 100:
-            raise ConfigError("ambient_volume_normal must be between 0 and 100")
-
-        ambient_volume_ducked = cls._require_int(root["ambient_volume_ducked"], "ambient_volume_ducked")
-        if not 0 <= ambient_volume_ducked <= 100:
-            raise ConfigError("ambient_volume_ducked must be between 0 and 100")
-
-        led_brightness = cls._require_range(root["led_brightness"], "led_brightness", 0.0, 1.0)
+        scalars = {name: read(root) for name, read in _TOP_LEVEL_READERS}
 
         return cls(
-            stop_keyword=str(root["stop_keyword"]),
-            ambient_volume_normal=ambient_volume_normal,
-            ambient_volume_ducked=ambient_volume_ducked,
-            silence_seconds=cls._require_positive_float(root["silence_seconds"], "silence_seconds"),
-            max_record_seconds=cls._require_positive_float(root["max_record_seconds"], "max_record_seconds"),
-            silence_threshold_multiplier=cls._require_positive_float(
-                root.get("silence_threshold_multiplier", 1.8), "silence_threshold_multiplier"
-            ),
-            gpio_pin_touch=cls._require_int(root["gpio_pin_touch"], "gpio_pin_touch"),
-            touch_bounce_seconds=cls._require_positive_float(
-                root.get("touch_bounce_seconds", 0.25), "touch_bounce_seconds"
-            ),
-            led_count=cls._require_positive_int(root["led_count"], "led_count"),
-            led_pin=cls._require_int(root["led_pin"], "led_pin"),
-            led_brightness=led_brightness,
-            led_dma=cls._require_positive_int(root.get("led_dma", 10), "led_dma"),
-            led_freq_hz=cls._require_positive_int(root.get("led_freq_hz", 800000), "led_freq_hz"),
-            led_invert=bool(root.get("led_invert", False)),
-            record_sample_rate=cls._require_positive_int(root.get("record_sample_rate", 16000), "record_sample_rate"),
-            record_channels=cls._require_positive_int(root.get("record_channels", 1), "record_channels"),
-            record_blocksize=cls._require_positive_int(root.get("record_blocksize", 1024), "record_blocksize"),
-            ambient_fade_step=cls._require_positive_int(root.get("ambient_fade_step", 1), "ambient_fade_step"),
-            ambient_fade_interval=cls._require_positive_float(
-                root.get("ambient_fade_interval", 0.08), "ambient_fade_interval"
-            ),
-            chat_system_prompt=str(root["chat_system_prompt"]),
+            **scalars,
             models=ModelConfig(
                 transcribe=str(models_data["transcribe"]),
                 chat=str(models_data["chat"]),
@@ -227,8 +187,8 @@ class OrbConfig:
                 ambient_loop=str(paths_data["ambient_loop"]),
                 glass_chime=str(paths_data["glass_chime"]),
                 down_chime=str(paths_data["down_chime"]),
-                tts_output=str(paths_data["tts_output"]),
                 mpv_socket=str(paths_data["mpv_socket"]),
+                tts_output=str(paths_data["tts_output"]) if paths_data.get("tts_output") is not None else None,
             ),
             dry_run=DryRunConfig(enabled=bool(dry_run_data.get("enabled", False))),
             wake_word=WakeWordConfig(
@@ -267,9 +227,73 @@ class OrbConfig:
         )
 
 
+_REQUIRED = object()
+
+
+def _as_str(value: Any, _key_path: str) -> str:
+    return str(value)
+
+
+def _as_bool(value: Any, _key_path: str) -> bool:
+    return bool(value)
+
+
+_volume = partial(OrbConfig._require_int_range, min_value=0, max_value=100)
+
+# Top-level scalar fields as (name, parser, default); _REQUIRED marks keys that must be present.
+# from_dict reads them through readers compiled from this table, so adding a scalar
+# setting only needs a new row here.
+_TOP_LEVEL_FIELDS: tuple[tuple[str, Callable[[Any, str], Any], Any], ...] = (
+    ("stop_keyword", _as_str, _REQUIRED),
+    ("ambient_volume_normal", _volume, _REQUIRED),
+    ("ambient_volume_ducked", _volume, _REQUIRED),
+    ("silence_seconds", OrbConfig._require_positive_float, _REQUIRED),
+    ("max_record_seconds", OrbConfig._require_positive_float, _REQUIRED),
+    ("silence_threshold_multiplier", OrbConfig._require_positive_float, 1.8),
+    ("gpio_pin_touch", OrbConfig._require_int, _REQUIRED),
+    ("touch_bounce_seconds", OrbConfig._require_positive_float, 0.25),
+    ("led_count", OrbConfig._require_positive_int, _REQUIRED),
+    ("led_pin", OrbConfig._require_int, _REQUIRED),
+    ("led_brightness", partial(OrbConfig._require_range, min_value=0.0, max_value=1.0), _REQUIRED),
+    ("led_dma", OrbConfig._require_positive_int, 10),
+    ("led_freq_hz", OrbConfig._require_positive_int, 800000),
+    ("led_invert", _as_bool, False),
+    ("record_sample_rate", OrbConfig._require_positive_int, 16000),
+    ("record_channels", OrbConfig._require_positive_int, 1),
+    ("record_blocksize", OrbConfig._require_positive_int, 1024),
+    ("ambient_fade_step", OrbConfig._require_positive_int, 1),
+    ("ambient_fade_interval", OrbConfig._require_positive_float, 0.08),
+    ("chat_system_prompt", _as_str, _REQUIRED),
+)
+_REQUIRED_TOP_LEVEL_KEYS = (
+    *(name for name, _parse, default in _TOP_LEVEL_FIELDS if default is _REQUIRED),
+    "models",
+    "paths",
+)
+
+
+def _compile_reader(name: str, parse: Callable[[Any, str], Any], default: Any) -> Callable[[dict[str, Any]], Any]:
+    """Specialize one table row into a reader with its key, parser and default bound in."""
+    if default is _REQUIRED:
+        # Presence was already checked against _REQUIRED_TOP_LEVEL_KEYS.
+        return lambda root: parse(root[name], name)
+    return lambda root: parse(root.get(name, default), name)
+
+
+# Built once at import so from_dict does a single call per field, with no per-field
+# required/default branching.
+_TOP_LEVEL_READERS: tuple[tuple[str, Callable[[dict[str, Any]], Any]], ...] = tuple(
+    (name, _compile_reader(name, parse, default)) for name, parse, default in _TOP_LEVEL_FIELDS
+)
+
+
 def load_config(path: str | Path) -> OrbConfig:
+    import yaml
+
+    # libyaml's C parser when PyYAML was built with it; same safe semantics either way.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with Path(path).open("r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=loader)
     if raw is None:
         raise ConfigError("config missing")
     return OrbConfig.from_dict(raw)
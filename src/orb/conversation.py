@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import TypedDict
 
@@ -10,42 +11,67 @@ class ChatMessage(TypedDict):
     content: str
 
 
+# Copying a prebuilt two-key dict and filling in the content is cheaper than building
+# each message literal. The role strings are identifier-like literals, which CPython
+# already interns, so no sys.intern is needed.
+_USER_MESSAGE: ChatMessage = {"role": "user", "content": ""}
+_ASSISTANT_MESSAGE: ChatMessage = {"role": "assistant", "content": ""}
+
+
 @dataclass
 class ConversationBuffer:
     max_turns: int
     reset_timeout_seconds: float | None = None
-    turns: list[ChatMessage] = field(default_factory=list)
-    _last_activity_ts: float | None = None
+    # Activity is tracked in integer monotonic nanoseconds; ``now`` arguments stay in seconds.
+    _last_activity_ns: int | None = None
+    _turns: deque[ChatMessage] = field(init=False, repr=False)
+    _timeout_ns: int | None = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # maxlen makes the deque evict the oldest messages itself, so no trim pass is needed.
+        self._turns = deque(maxlen=self.max_turns * 2)
+        self._timeout_ns = None if self.reset_timeout_seconds is None else _to_ns(self.reset_timeout_seconds)
+
+    @property
+    def turns(self) -> list[ChatMessage]:
+        return list(self._turns)
 
     def maybe_reset_for_inactivity(self, now: float | None = None) -> bool:
-        if self.reset_timeout_seconds is None:
+        if self._timeout_ns is None:
             return False
 
-        current = time.monotonic() if now is None else now
-        if self._last_activity_ts is None:
-            self._last_activity_ts = current
+        current = _now_ns(now)
+        if self._last_activity_ns is None:
+            self._last_activity_ns = current
             return False
 
-        if current - self._last_activity_ts >= self.reset_timeout_seconds:
-            self.reset(now=current)
+        if current - self._last_activity_ns >= self._timeout_ns:
+            self._turns.clear()
+            self._last_activity_ns = current
             return True
 
         return False
 
     def add_turn(self, user_text: str, assistant_text: str, now: float | None = None) -> None:
-        self.turns.append({"role": "user", "content": user_text})
-        self.turns.append({"role": "assistant", "content": assistant_text})
-        self._trim_to_max_turns()
-        self._last_activity_ts = time.monotonic() if now is None else now
+        user = _USER_MESSAGE.copy()
+        user["content"] = user_text
+        assistant = _ASSISTANT_MESSAGE.copy()
+        assistant["content"] = assistant_text
+        self._turns.append(user)
+        self._turns.append(assistant)
+        self._last_activity_ns = _now_ns(now)
 
     def reset(self, now: float | None = None) -> None:
-        self.turns.clear()
-        self._last_activity_ts = time.monotonic() if now is None else now
+        self._turns.clear()
+        self._last_activity_ns = _now_ns(now)
 
     def build_messages(self, system_prompt: str, latest_user_text: str) -> list[ChatMessage]:
-        return [{"role": "system", "content": system_prompt}, *self.turns, {"role": "user", "content": latest_user_text}]
+        return [{"role": "system", "content": system_prompt}, *self._turns, {"role": "user", "content": latest_user_text}]
+
+
+def _to_ns(seconds: float) -> int:
+    return round(seconds * 1_000_000_000)
+
 
-    def _trim_to_max_turns(self) -> None:
-        max_messages = self.max_turns * 2
-        if len(self.turns) > max_messages:
-            self.turns = self.turns[-max_messages:]
+def _now_ns(now: float | None) -> int:
+    return time.monotonic_ns() if now is None else _to_ns(now)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+import os
+import selectors
+import sys
 import threading
-import time
 from typing import Callable
 
 
@@ -35,6 +37,34 @@ class GPIOTouchInput(TouchInterface):
         self.button.close()
 
 
+def _poll_stdin_lines(stop: threading.Event, on_line: Callable[[str], None]) -> None:
+    """Call ``on_line`` for each line typed on stdin until ``stop`` is set or input ends.
+
+    stdin is polled with a short timeout instead of a blocking ``input()``, so the
+    loop notices ``stop`` promptly and the owning thread can be joined.
+    """
+    pending = ""
+    with selectors.DefaultSelector() as selector:
+        try:
+            fd = sys.stdin.fileno()
+            selector.register(fd, selectors.EVENT_READ)
+        except (ValueError, OSError) as exc:
+            logging.warning("stdin cannot be polled (%s); keyboard input disabled.", exc)
+            return
+        while not stop.is_set():
+            if not selector.select(timeout=0.2):
+                continue
+            # Read the raw descriptor: a buffered readline() could pull several lines
+            # into Python's buffer where select() can no longer see them.
+            chunk = os.read(fd, 4096)
+            if not chunk or stop.is_set():
+                break
+            pending += chunk.decode(errors="replace")
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                on_line(line)
+
+
 class KeyboardTouchInput(TouchInterface):
     def __init__(self) -> None:
         self._thread: threading.Thread | None = None
@@ -43,21 +73,15 @@ class KeyboardTouchInput(TouchInterface):
     def start(self, callback: Callable[[], None]) -> None:
         def loop() -> None:
             logging.info("Dry run enabled: press ENTER to simulate touch.")
-            while not self._stop.is_set():
-                try:
-                    _ = input()
-                except EOFError:
-                    time.sleep(0.2)
-                    continue
-                if self._stop.is_set():
-                    break
-                callback()
+            _poll_stdin_lines(self._stop, lambda _line: callback())
 
         self._thread = threading.Thread(target=loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
 
 
 class NullWakeWordInput(WakeWordInput):
@@ -75,24 +99,21 @@ class KeyboardWakeWordInput(WakeWordInput):
         self._stop = threading.Event()
 
     def start(self, callback: Callable[[], None]) -> None:
+        def on_line(line: str) -> None:
+            if line.strip().lower() == self.keyword.lower():
+                callback()
+
         def loop() -> None:
             logging.info('Wake-word dry run enabled: type "%s" then ENTER to trigger.', self.keyword)
-            while not self._stop.is_set():
-                try:
-                    line = input()
-                except EOFError:
-                    time.sleep(0.2)
-                    continue
-                if self._stop.is_set():
-                    break
-                if line.strip().lower() == self.keyword.lower():
-                    callback()
+            _poll_stdin_lines(self._stop, on_line)
 
         self._thread = threading.Thread(target=loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
 
 
 def build_touch_input(dry_run: bool, pin: int, bounce_seconds: float) -> TouchInterface:
@@ -101,13 +122,20 @@ def build_touch_input(dry_run: bool, pin: int, bounce_seconds: float) -> TouchIn
     return GPIOTouchInput(pin=pin, bounce_seconds=bounce_seconds)
 
 
+# Wake-word engines by lower-cased config name. Only the keyboard mock ships for now, to
+# keep hardware/software dependencies optional; dry runs always use it.
+_WAKE_WORD_ENGINES: dict[str, Callable[..., WakeWordInput]] = {
+    "mock": KeyboardWakeWordInput,
+}
+
+
 def build_wake_word_input(enabled: bool, dry_run: bool, keyword: str, engine: str) -> WakeWordInput:
     if not enabled:
         return NullWakeWordInput()
 
-    # Placeholder implementation to keep hardware/software dependencies optional.
-    if dry_run or engine.lower() == "mock":
-        return KeyboardWakeWordInput(keyword=keyword)
+    factory = KeyboardWakeWordInput if dry_run else _WAKE_WORD_ENGINES.get(engine.lower())
+    if factory is not None:
+        return factory(keyword=keyword)
 
     logging.warning(
         "Wake-word engine '%s' is not implemented in this build; wake-word listener disabled.",
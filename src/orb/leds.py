@@ -5,9 +5,34 @@ import math
 import threading
 import time
 from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
 
 from .state import OrbState
 
+_FRAME_INTERVAL_S = 0.05
+# Refresh only as fast as each state's animation needs: the breathing pulse is slow,
+# the error blink toggles every 1/6 s (sampled twice per toggle so it never aliases),
+# and anything else is a static fill that only has to notice state changes.
+_FRAME_INTERVALS_S = {
+    OrbState.AMBIENT: _FRAME_INTERVAL_S,
+    OrbState.SPEAKING: _FRAME_INTERVAL_S,
+    OrbState.LISTENING: 0.1,
+    OrbState.ERROR: 1 / 12,
+}
+_STATIC_FRAME_INTERVAL_S = 0.25
+
+# Per-channel (r, g, b) coefficients for the animated frames.
+_AMBIENT_BASE = np.array([2, 22, 26], dtype=np.float32)
+_AMBIENT_SWING = np.array([8, 25, 40], dtype=np.float32)
+_SPEAKING_COLOR = np.array([6, 40, 56], dtype=np.float32)
+
+# One sine period sampled finely enough for 8-bit colour; animations gather from it
+# instead of evaluating sin per pixel.
+_SIN_LUT_SIZE = 1024
+_SIN_LUT = np.sin(np.linspace(0.0, math.tau, _SIN_LUT_SIZE, endpoint=False)).astype(np.float32)
+
 
 @dataclass
 class LedConfig:
@@ -23,11 +48,41 @@ class OrbLEDController:
     def __init__(self, config: LedConfig, dry_run: bool = False) -> None:
         self._config = config
         self._state = OrbState.AMBIENT
-        self._stop = threading.Event()
+        # Guards the state/level hand-off; notified so a change renders immediately
+        # rather than at the next (possibly slow) refresh.
+        self._cond = threading.Condition()
+        self._stop_flag = False
+        self._changed = False
         self._thread: threading.Thread | None = None
         self._speak_level = 0.0
+        # (start, window start offsets, levels) envelope sampled by the animation thread
+        # while speaking, and the thread's forward-only read position within it.
+        self._speak_schedule: tuple[float, list[float], list[float]] | None = None
+        self._speak_cursor: tuple[object, int] = (None, 0)
         self._dry_run = dry_run
         self._pixels = None
+        # Last frame sent to the strip, so unchanged frames skip the driver writes and show().
+        self._last_packed: np.ndarray | None = None
+        self._last_fill: tuple[int, int, int] | None = None
+        # Each pixel's position around the ring in sine-table steps; constant for the strip's lifetime.
+        self._phases = np.arange(config.count, dtype=np.float32) * np.float32(_SIN_LUT_SIZE / max(1, config.count))
+        self._lut_idx = np.empty(config.count, dtype=np.int32)
+        # Per-state frame renderers; states without an animation get the static fill.
+        self._frame_fns: dict[OrbState, Callable[[float], None]] = {
+            OrbState.AMBIENT: self._ambient_frame,
+            OrbState.LISTENING: self._listening_frame,
+            OrbState.SPEAKING: self._speaking_frame,
+            OrbState.ERROR: self._error_frame,
+        }
+        # Frames are rendered into per-channel buffers reused for every frame; only
+        # _blit packs them into driver words.
+        self._r = np.zeros(config.count, dtype=np.uint8)
+        self._g = np.zeros(config.count, dtype=np.uint8)
+        self._b = np.zeros(config.count, dtype=np.uint8)
+        self._wave = np.empty(config.count, dtype=np.float32)
+        self._scratch = np.empty(config.count, dtype=np.float32)
+        self._packed = np.empty(config.count, dtype=np.uint32)
+        self._packed_scratch = np.empty(config.count, dtype=np.uint32)
 
         if not dry_run:
             import rpi_ws281x
@@ -50,42 +105,88 @@ class OrbLEDController:
         self._thread.start()
 
     def stop(self) -> None:
-        self._stop.set()
+        with self._cond:
+            self._stop_flag = True
+            self._cond.notify_all()
         if self._thread:
             self._thread.join(timeout=1.0)
         self._fill(0, 0, 0)
 
     def set_state(self, state: OrbState) -> None:
-        self._state = state
+        with self._cond:
+            self._state = state
+            self._changed = True
+            self._cond.notify()
 
     def set_speaking_level(self, level: float) -> None:
-        self._speak_level = max(0.0, min(1.0, level))
+        with self._cond:
+            self._speak_level = max(0.0, min(1.0, level))
+            self._changed = True
+            self._cond.notify()
+
+    def queue_speaking_levels(self, levels: Sequence[float], hz: float = 20.0, start: float | None = None) -> None:
+        """Follow a precomputed level envelope sampled at ``hz``, starting at monotonic time ``start``.
+
+        The animation thread picks the current level itself, so callers don't need to
+        wake up to push levels while audio plays.
+        """
+        clipped = np.clip(np.asarray(levels, dtype=np.float32), 0.0, 1.0)
+        if len(clipped) == 0:
+            return
+        offsets = (np.arange(len(clipped)) / hz).tolist()
+        with self._cond:
+            self._speak_schedule = (time.monotonic() if start is None else start, offsets, clipped.tolist())
+            self._changed = True
+            self._cond.notify()
+
+    def clear_speaking_levels(self) -> None:
+        with self._cond:
+            self._speak_schedule = None
+            self._speak_level = 0.0
+            self._changed = True
+            self._cond.notify()
 
     def _run(self) -> None:
-        t = 0.0
-        while not self._stop.is_set():
-            if self._state == OrbState.AMBIENT:
-                self._ambient_frame(t)
-            elif self._state == OrbState.LISTENING:
-                self._listening_frame(t)
-            elif self._state == OrbState.SPEAKING:
-                self._speaking_frame(t)
-            elif self._state == OrbState.ERROR:
-                self._error_frame(t)
-            else:
-                self._fill(6, 10, 12)
-            t += 0.05
-            time.sleep(0.05)
+        # Animation time follows the monotonic clock and frames are paced against
+        # deadlines, so slow frames don't stretch the animation or drift its phase.
+        t0 = time.monotonic()
+        next_deadline = t0
+        while True:
+            with self._cond:
+                if self._stop_flag:
+                    break
+                self._changed = False
+                state = self._state
+            self._frame_fns.get(state, self._static_frame)(time.monotonic() - t0)
+            next_deadline += _FRAME_INTERVALS_S.get(state, _STATIC_FRAME_INTERVAL_S)
+            with self._cond:
+                sleep_for = next_deadline - time.monotonic()
+                if sleep_for > 0 and self._cond.wait_for(lambda: self._stop_flag or self._changed, sleep_for):
+                    # Woken by a change: render it now and pace later frames from here.
+                    next_deadline = time.monotonic()
+                elif sleep_for <= 0:
+                    # Running behind: resync instead of rendering a burst of catch-up frames.
+                    next_deadline = time.monotonic()
+
+    def _sine_wave(self, speed: float, t: float) -> np.ndarray:
+        """Fill ``self._wave`` with ``sin(phase + speed * t)`` for every pixel via the sine table."""
+        # Reduce the time offset modulo one period in double precision first, so the
+        # indices stay small and non-negative however long the orb has been running.
+        offset = (speed * t * (_SIN_LUT_SIZE / math.tau)) % _SIN_LUT_SIZE
+        np.add(self._phases, np.float32(offset), out=self._scratch)
+        np.copyto(self._lut_idx, self._scratch, casting="unsafe")
+        self._lut_idx &= _SIN_LUT_SIZE - 1
+        return np.take(_SIN_LUT, self._lut_idx, out=self._wave)
 
     def _ambient_frame(self, t: float) -> None:
-        for i in range(self._config.count):
-            phase = (i / max(1, self._config.count)) * math.tau
-            ripple = 0.5 + 0.5 * math.sin(phase + t * 0.8)
-            r = int(2 + 8 * ripple)
-            g = int(22 + 25 * ripple)
-            b = int(26 + 40 * ripple)
-            self._set_pixel(i, r, g, b)
-        self._show()
+        ripple = self._sine_wave(0.8, t)
+        ripple *= np.float32(0.5)
+        ripple += np.float32(0.5)
+        for channel, base, swing in zip((self._r, self._g, self._b), _AMBIENT_BASE, _AMBIENT_SWING):
+            np.multiply(ripple, swing, out=self._scratch)
+            self._scratch += base
+            np.copyto(channel, self._scratch, casting="unsafe")
+        self._blit()
 
     def _listening_frame(self, t: float) -> None:
         breathe = 0.35 + 0.65 * (0.5 + 0.5 * math.sin(t * 2.2))
@@ -93,32 +194,73 @@ class OrbLEDController:
         self._fill(*color)
 
     def _speaking_frame(self, t: float) -> None:
-        amplitude = 0.2 + 0.8 * self._speak_level
-        for i in range(self._config.count):
-            wave = 0.5 + 0.5 * math.sin((i / self._config.count) * math.tau - (t * 4.5))
-            intensity = (0.25 + 0.75 * wave) * amplitude
-            self._set_pixel(i, int(6 * intensity), int(40 * intensity), int(56 * intensity))
-        self._show()
+        # Held while reading the schedule and storing the level, so a concurrent
+        # clear_speaking_levels() can't be overwritten by this frame.
+        with self._cond:
+            schedule = self._speak_schedule
+            if schedule is not None:
+                start, offsets, levels = schedule
+                cursor_schedule, idx = self._speak_cursor
+                if cursor_schedule is not schedule:
+                    idx = 0
+                # Playback only moves forward, so advance from the last window instead of
+                # recomputing (and clamping) the index every frame.
+                elapsed = time.monotonic() - start
+                last = len(levels) - 1
+                while idx < last and offsets[idx + 1] <= elapsed:
+                    idx += 1
+                self._speak_cursor = (schedule, idx)
+                self._speak_level = levels[idx]
+            amplitude = 0.2 + 0.8 * self._speak_level
+        # intensity = (0.25 + 0.75 * (0.5 + 0.5 * sin(phase - 4.5t))) * amplitude
+        intensity = self._sine_wave(-4.5, t)
+        intensity *= np.float32(0.375 * amplitude)
+        intensity += np.float32(0.625 * amplitude)
+        for channel, level in zip((self._r, self._g, self._b), _SPEAKING_COLOR):
+            np.multiply(intensity, level, out=self._scratch)
+            np.copyto(channel, self._scratch, casting="unsafe")
+        self._blit()
+
+    def _static_frame(self, _t: float) -> None:
+        self._fill(6, 10, 12)
 
     def _error_frame(self, t: float) -> None:
         blink = 1.0 if int(t * 6) % 2 == 0 else 0.1
         self._fill(int(35 * blink), int(8 * blink), int(8 * blink))
 
     def _fill(self, r: int, g: int, b: int) -> None:
-        for i in range(self._config.count):
-            self._set_pixel(i, r, g, b)
-        self._show()
-
-    def _set_pixel(self, idx: int, r: int, g: int, b: int) -> None:
-        if self._dry_run:
+        color = (r, g, b)
+        if color == self._last_fill:
             return
-        import rpi_ws281x
+        self._r.fill(r)
+        self._g.fill(g)
+        self._b.fill(b)
+        self._blit()
+        self._last_fill = color
 
-        assert self._pixels is not None
-        self._pixels.setPixelColor(idx, rpi_ws281x.Color(r, g, b))
-
-    def _show(self) -> None:
+    def _blit(self) -> None:
+        """Push the current r/g/b channel buffers to the strip and show them, unless unchanged."""
+        self._last_fill = None
         if self._dry_run:
             return
         assert self._pixels is not None
+        # Pack to rpi_ws281x.Color's 0x00RRGGBB layout in place; the strip reorders
+        # channels for its strip type, so only the plain ints cross into the driver.
+        packed, scratch = self._packed, self._packed_scratch
+        np.copyto(packed, self._r)
+        packed <<= 16
+        np.copyto(scratch, self._g)
+        scratch <<= 8
+        packed |= scratch
+        np.copyto(scratch, self._b)
+        packed |= scratch
+        if self._last_packed is not None and np.array_equal(packed, self._last_packed):
+            return
+        set_pixel = self._pixels.setPixelColor
+        for idx, color in enumerate(packed.tolist()):
+            set_pixel(idx, color)
         self._pixels.show()
+        if self._last_packed is None:
+            self._last_packed = packed.copy()
+        else:
+            np.copyto(self._last_packed, packed)
@@ -3,10 +3,13 @@ from __future__ import annotations
 import argparse
 import logging
 import os
+import re
 import subprocess
 import threading
 import time
-from pathlib import Path
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator
 
 from .audio import AmbientPlayer, AudioIO
 from .config import ConfigError, load_config
@@ -17,6 +20,15 @@ from .openai_client import OrbOpenAIClient
 from .state import OrbState
 from .web import OrbWebServer, OrbWebStatus
 
+# Streamed replies have no envelope until the whole MP3 has arrived, so the LEDs hold
+# a steady mid-level glow while mpv plays.
+_STREAMED_SPEECH_LEVEL = 0.6
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class SpeechOutputError(RuntimeError):
+    """Raised when TTS or mpv fails while a fully or partly generated reply is being spoken."""
+
 
 def setup_logging() -> None:
     logging.basicConfig(
@@ -33,13 +45,82 @@ def play_with_led_sync(audio_path: str, leds: OrbLEDController, audio: AudioIO)
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
     )
-    start = time.time()
-    while proc.poll() is None:
-        elapsed = time.time() - start
-        idx = min(int(elapsed * 20), len(levels) - 1)
-        leds.set_speaking_level(levels[idx])
-        time.sleep(0.05)
-    leds.set_speaking_level(0.0)
+    # The LED thread follows the envelope on its own clock; just wait for playback to end.
+    leds.queue_speaking_levels(levels)
+    try:
+        proc.wait()
+    finally:
+        leds.clear_speaking_levels()
+
+
+def iter_sentences(deltas: Iterable[str], parts: list[str]) -> Iterator[str]:
+    """Yield each sentence of a streamed reply as soon as it ends.
+
+    Every delta is also appended to ``parts`` so the caller can rebuild the full text.
+    """
+    pending = ""
+    for delta in deltas:
+        parts.append(delta)
+        pending += delta
+        *complete, pending = _SENTENCE_END.split(pending)
+        for sentence in complete:
+            if sentence.strip():
+                yield sentence.strip()
+    if pending.strip():
+        yield pending.strip()
+
+
+def stream_tts_with_led_sync(
+    ai: OrbOpenAIClient,
+    sentences: Iterable[str],
+    model: str,
+    leds: OrbLEDController,
+    on_first_sentence: Callable[[], None] | None = None,
+) -> None:
+    """Speak ``sentences`` through one mpv process as they arrive.
+
+    ``on_first_sentence`` runs when the first sentence is handed to TTS, so callers can
+    stay in PROCESSING while the chat request is still waiting for its first tokens.
+    """
+    proc = subprocess.Popen(
+        ["mpv", "--no-video", "--really-quiet", "-"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    # One worker keeps sentences in order on mpv's stdin while this thread keeps
+    # pulling the next sentence, so chat generation, TTS download and playback overlap.
+    tts_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="orb-tts")
+    pending: deque[Future[None]] = deque()
+    started = False
+    try:
+        for sentence in sentences:
+            if not started:
+                started = True
+                if on_first_sentence is not None:
+                    on_first_sentence()
+                leds.set_speaking_level(_STREAMED_SPEECH_LEVEL)
+            # Raise a failed sentence now instead of after the whole reply has been generated.
+            while pending and pending[0].done():
+                _raise_speech_error(pending.popleft())
+            pending.append(tts_worker.submit(ai.tts_stream, sentence, model, proc.stdin))
+        for future in pending:
+            _raise_speech_error(future)
+    finally:
+        tts_worker.shutdown(cancel_futures=True)
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        proc.wait()
+        leds.set_speaking_level(0.0)
+
+
+def _raise_speech_error(future: Future[None]) -> None:
+    try:
+        future.result()
+    except Exception as exc:
+        raise SpeechOutputError(f"Speaking the reply failed: {exc}") from exc
 
 
 def run() -> None:
@@ -60,7 +141,8 @@ def run() -> None:
     if not os.getenv("OPENAI_API_KEY") and not dry_run:
         raise RuntimeError("OPENAI_API_KEY is not set")
 
-    Path(cfg.paths.tts_output).parent.mkdir(parents=True, exist_ok=True)
+    if cfg.paths.tts_output is not None:
+        logging.warning("paths.tts_output is deprecated and ignored; replies are streamed straight to mpv")
 
     leds = OrbLEDController(
         LedConfig(
@@ -88,6 +170,10 @@ def run() -> None:
         with simulation_lock:
             return simulation_enabled
 
+    def start_speaking() -> None:
+        leds.set_state(OrbState.SPEAKING)
+        web_status.set_state(OrbState.SPEAKING)
+
     def trigger_interaction() -> None:
         if not touch_event.is_set():
             logging.info("Trigger detected")
@@ -176,6 +262,10 @@ def run() -> None:
                 if get_simulation_enabled():
                     transcript = "[simulated transcript]"
                     reply = "[simulated reply]"
+                    web_status.set_last_transcript(transcript)
+                    web_status.set_last_reply(reply)
+                    start_speaking()
+                    play_with_led_sync(cfg.paths.down_chime, leds, audio)
                 else:
                     recording = audio.record_until_stop(
                         silence_seconds=cfg.silence_seconds,
@@ -227,22 +317,32 @@ def run() -> None:
                             {"role": "user", "content": transcript},
                         ]
 
-                    reply = ai.chat(messages=messages, model=cfg.models.chat)
+                    reply_parts: list[str] = []
+                    speech_error: SpeechOutputError | None = None
+                    try:
+                        stream_tts_with_led_sync(
+                            ai,
+                            iter_sentences(ai.chat_stream(messages=messages, model=cfg.models.chat), reply_parts),
+                            cfg.models.tts,
+                            leds,
+                            on_first_sentence=start_speaking,
+                        )
+                    except SpeechOutputError as exc:
+                        # The reply itself was fine and may already be partly heard, so keep the
+                        # turn; chat errors propagate without recording a truncated reply.
+                        speech_error = exc
+                    reply = "".join(reply_parts).strip()
                     logging.info("Assistant: %s", reply)
 
                     if cfg.conversation.enabled:
                         conversation.add_turn(transcript, reply)
+                    web_status.set_last_transcript(transcript)
+                    web_status.set_last_reply(reply)
+                    if speech_error is not None:
+                        raise speech_error
 
-                web_status.set_last_transcript(transcript)
-                web_status.set_last_reply(reply)
                 web_status.set_last_error(None)
 
-                tts_path = ai.tts(reply, cfg.models.tts, cfg.paths.tts_output) if not get_simulation_enabled() else cfg.paths.down_chime
-
-                leds.set_state(OrbState.SPEAKING)
-                web_status.set_state(OrbState.SPEAKING)
-                play_with_led_sync(tts_path, leds, audio)
-
                 ambient.fade_to(cfg.ambient_volume_normal)
                 leds.set_state(OrbState.AMBIENT)
                 web_status.set_state(OrbState.AMBIENT)
@@ -269,6 +369,7 @@ def run() -> None:
         ambient.stop()
         web_status.set_ambient_running(False)
         leds.stop()
+        ai.close()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from pathlib import Path
-from typing import Any
-
-from openai import OpenAI
+from typing import Any, BinaryIO, Iterator
 
 
 logger = logging.getLogger(__name__)
@@ -13,7 +12,32 @@ FALLBACK_ASSISTANT_TEXT = "Sorry, I didn't catch that. Please try asking again."
 
 class OrbOpenAIClient:
     def __init__(self, api_key: str | None = None) -> None:
-        self.client = OpenAI(api_key=api_key)
+        self._api_key = api_key
+        self._http: Any = None
+
+    @cached_property
+    def client(self) -> Any:
+        # The SDK and its HTTP stack are slow to import on a Pi; defer both until the
+        # first API call and reuse the instance afterwards.
+        import httpx
+        from openai import OpenAI
+
+        # One pooled HTTP/2 client keeps the TLS connection warm across the
+        # transcribe -> chat -> tts legs of an interaction.
+        self._http = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=None),
+        )
+        return OpenAI(api_key=self._api_key, http_client=self._http)
+
+    def close(self) -> None:
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        # The cached OpenAI instance wraps the closed transport; drop it so the next
+        # call builds a fresh one.
+        self.__dict__.pop("client", None)
 
     def transcribe(self, audio_path: str, model: str) -> str:
         with Path(audio_path).open("rb") as audio_file:
@@ -47,9 +71,9 @@ class OrbOpenAIClient:
         content = getattr(message, "content", None)
 
         if isinstance(content, str):
-            cleaned = content.strip()
-            if cleaned:
-                return cleaned
+            # isspace() rejects blank content without building a stripped copy first.
+            if content and not content.isspace():
+                return content.strip()
         elif isinstance(content, list):
             extracted_parts: list[str] = []
             for part in content:
@@ -74,16 +98,39 @@ class OrbOpenAIClient:
         )
         return FALLBACK_ASSISTANT_TEXT
 
-    def tts(self, text: str, model: str, output_path: str, voice: str = "alloy") -> str:
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    def chat_stream(self, messages: list[dict[str, str]], model: str) -> Iterator[str]:
+        """Yield assistant text deltas as they arrive, falling back like :meth:`chat`."""
+        stream = self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.5,
+            max_tokens=140,
+            stream=True,
+        )
+
+        produced_text = False
+        for chunk in stream:
+            if not getattr(chunk, "choices", None):
+                continue
+            delta = getattr(chunk.choices[0].delta, "content", None)
+            if isinstance(delta, str) and delta:
+                produced_text = produced_text or bool(delta.strip())
+                yield delta
+
+        if not produced_text:
+            logger.warning("OpenAI chat stream returned no usable text; using fallback response (model=%s)", model)
+            yield FALLBACK_ASSISTANT_TEXT
+
+    def tts_stream(self, text: str, model: str, sink: BinaryIO, voice: str = "alloy") -> None:
+        """Write MP3 chunks to ``sink`` as they arrive so playback can start early."""
         with self.client.audio.speech.with_streaming_response.create(
             model=model,
             voice=voice,
             input=text,
             format="mp3",
         ) as response:
-            response.stream_to_file(output_path)
-        return output_path
+            for chunk in response.iter_bytes():
+                sink.write(chunk)
 
 
 def _extract_text_attr(value: Any) -> str | None:
@@ -6,10 +6,20 @@ import threading
 from dataclasses import dataclass
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Callable
+from typing import Any, Callable
 
 from .state import OrbState
 
+# Each keep-alive connection holds its own (daemon) thread until it goes idle this long.
+_KEEPALIVE_IDLE_S = 5.0
+
+# Default for OrbWebStatus.apply arguments that were not passed; None is a real value there.
+_UNSET: Any = object()
+
+
+def _json_bytes(payload: dict[str, object]) -> bytes:
+    return json.dumps(payload).encode("utf-8")
+
 
 @dataclass
 class OrbWebSnapshot:
@@ -32,12 +42,17 @@ class OrbWebStatus:
         self._last_transcript_summary: str | None = None
         self._last_reply_summary: str | None = None
         self._last_error: str | None = None
+        self._state_json_cache: bytes | None = None
+        self._health_json_cache: bytes | None = None
 
     @staticmethod
     def _summarize_text(value: str, max_len: int = 80) -> str:
-        normalized = " ".join(value.split())
+        # Only normalize a bounded head of the text: this runs under the status lock
+        # and only the first max_len characters are ever shown.
+        head_len = max_len * 3
+        normalized = " ".join(value[:head_len].split())
         preview = normalized[:max_len]
-        if len(normalized) > max_len:
+        if len(value) > head_len or len(normalized) > max_len:
             preview += "…"
         return f"{preview} (chars={len(value)})"
 
@@ -53,29 +68,82 @@ class OrbWebStatus:
                 last_error=self._last_error,
             )
 
-    def set_state(self, state: OrbState) -> None:
+    def state_json(self) -> bytes:
+        """Serialized ``/state`` payload, rebuilt only after a setter changed something."""
+        with self._lock:
+            if self._state_json_cache is None:
+                self._state_json_cache = json.dumps(
+                    {
+                        "state": self._state.value,
+                        "dry_run": self._dry_run,
+                        "simulation_enabled": self._simulation_enabled,
+                        "last_transcript_summary": self._last_transcript_summary,
+                        "last_reply_summary": self._last_reply_summary,
+                    }
+                ).encode("utf-8")
+            return self._state_json_cache
+
+    def health_json(self) -> bytes:
+        """Serialized ``/health`` payload, cached the same way as :meth:`state_json`."""
+        with self._lock:
+            if self._health_json_cache is None:
+                self._health_json_cache = json.dumps(
+                    {
+                        "ok": self._last_error is None,
+                        "ambient_running": self._ambient_running,
+                        "last_error": self._last_error,
+                    }
+                ).encode("utf-8")
+            return self._health_json_cache
+
+    def _invalidate_json(self) -> None:
+        # Callers hold self._lock.
+        self._state_json_cache = None
+        self._health_json_cache = None
+
+    def apply(
+        self,
+        *,
+        state: OrbState = _UNSET,
+        ambient_running: bool = _UNSET,
+        simulation_enabled: bool = _UNSET,
+        last_transcript: str | None = _UNSET,
+        last_reply: str | None = _UNSET,
+        last_error: str | None = _UNSET,
+    ) -> None:
+        """Update the given fields under one lock acquisition; omitted fields are left alone."""
         with self._lock:
-            self._state = state
+            if state is not _UNSET:
+                self._state = state
+            if ambient_running is not _UNSET:
+                self._ambient_running = ambient_running
+            if simulation_enabled is not _UNSET:
+                self._simulation_enabled = simulation_enabled
+            if last_transcript is not _UNSET:
+                self._last_transcript_summary = None if last_transcript is None else self._summarize_text(last_transcript)
+            if last_reply is not _UNSET:
+                self._last_reply_summary = None if last_reply is None else self._summarize_text(last_reply)
+            if last_error is not _UNSET:
+                self._last_error = last_error
+            self._invalidate_json()
+
+    def set_state(self, state: OrbState) -> None:
+        self.apply(state=state)
 
     def set_ambient_running(self, running: bool) -> None:
-        with self._lock:
-            self._ambient_running = running
+        self.apply(ambient_running=running)
 
     def set_last_transcript(self, transcript: str) -> None:
-        with self._lock:
-            self._last_transcript_summary = self._summarize_text(transcript)
+        self.apply(last_transcript=transcript)
 
     def set_last_reply(self, reply: str) -> None:
-        with self._lock:
-            self._last_reply_summary = self._summarize_text(reply)
+        self.apply(last_reply=reply)
 
     def set_last_error(self, error: str | None) -> None:
-        with self._lock:
-            self._last_error = error
+        self.apply(last_error=error)
 
     def set_simulation_enabled(self, enabled: bool) -> None:
-        with self._lock:
-            self._simulation_enabled = enabled
+        self.apply(simulation_enabled=enabled)
 
 
 class OrbWebServer:
@@ -98,6 +166,36 @@ class OrbWebServer:
         self._httpd: ThreadingHTTPServer | None = None
         self._thread: threading.Thread | None = None
 
+    def dispatch(self, method: str, path: str, body: bytes = b"") -> tuple[HTTPStatus, bytes]:
+        """Route one request to its endpoint and return the status and JSON body.
+
+        The socket handler goes through here as well, so tests can call it in-process.
+        """
+        if method == "GET":
+            if path == "/health":
+                return HTTPStatus.OK, self._status.health_json()
+            if path == "/state":
+                return HTTPStatus.OK, self._status.state_json()
+        elif method == "POST":
+            if path == "/actions/trigger":
+                self._trigger_interaction()
+                return HTTPStatus.OK, _json_bytes({"triggered": True})
+
+            if path == "/actions/reset":
+                self._reset_conversation()
+                return HTTPStatus.OK, _json_bytes({"reset": True})
+
+            if path == "/actions/simulation":
+                try:
+                    payload = json.loads(body or b"{}")
+                except json.JSONDecodeError:
+                    return HTTPStatus.BAD_REQUEST, _json_bytes({"error": "invalid JSON"})
+                enabled = bool(payload.get("enabled", False))
+                self._set_simulation_enabled(enabled)
+                return HTTPStatus.OK, _json_bytes({"simulation_enabled": enabled})
+
+        return HTTPStatus.NOT_FOUND, _json_bytes({"error": "not found"})
+
     def start(self) -> None:
         if self._httpd is not None:
             return
@@ -105,62 +203,27 @@ class OrbWebServer:
         server = self
 
         class Handler(BaseHTTPRequestHandler):
+            # HTTP/1.1 keeps the polling dashboard on one connection; every response
+            # carries Content-Length, and idle connections time out to end their thread.
+            protocol_version = "HTTP/1.1"
+            timeout = _KEEPALIVE_IDLE_S
+
             def do_GET(self) -> None:  # noqa: N802
-                if self.path == "/health":
-                    snap = server._status.snapshot()
-                    self._json_response(
-                        {
-                            "ok": snap.last_error is None,
-                            "ambient_running": snap.ambient_running,
-                            "last_error": snap.last_error,
-                        }
-                    )
-                    return
-                if self.path == "/state":
-                    snap = server._status.snapshot()
-                    self._json_response(
-                        {
-                            "state": snap.state.value,
-                            "dry_run": snap.dry_run,
-                            "simulation_enabled": snap.simulation_enabled,
-                            "last_transcript_summary": snap.last_transcript_summary,
-                            "last_reply_summary": snap.last_reply_summary,
-                        }
-                    )
-                    return
-                self._json_response({"error": "not found"}, status=HTTPStatus.NOT_FOUND)
+                status, body = server.dispatch("GET", self.path)
+                self._send_json_bytes(body, status)
 
             def do_POST(self) -> None:  # noqa: N802
-                if self.path == "/actions/trigger":
-                    server._trigger_interaction()
-                    self._json_response({"triggered": True})
-                    return
-
-                if self.path == "/actions/reset":
-                    server._reset_conversation()
-                    self._json_response({"reset": True})
-                    return
-
-                if self.path == "/actions/simulation":
-                    content_len = int(self.headers.get("Content-Length", "0"))
-                    raw_body = self.rfile.read(content_len) if content_len > 0 else b"{}"
-                    try:
-                        payload = json.loads(raw_body)
-                    except json.JSONDecodeError:
-                        self._json_response({"error": "invalid JSON"}, status=HTTPStatus.BAD_REQUEST)
-                        return
-                    enabled = bool(payload.get("enabled", False))
-                    server._set_simulation_enabled(enabled)
-                    self._json_response({"simulation_enabled": enabled})
-                    return
-
-                self._json_response({"error": "not found"}, status=HTTPStatus.NOT_FOUND)
+                # Always consume the body: on a keep-alive connection unread bytes would
+                # be parsed as the start of the next request.
+                content_len = int(self.headers.get("Content-Length", "0"))
+                raw_body = self.rfile.read(content_len) if content_len > 0 else b""
+                status, body = server.dispatch("POST", self.path, raw_body)
+                self._send_json_bytes(body, status)
 
             def log_message(self, format: str, *args) -> None:  # noqa: A003
                 logging.debug("web: " + format, *args)
 
-            def _json_response(self, payload: dict[str, object], status: HTTPStatus = HTTPStatus.OK) -> None:
-                body = json.dumps(payload).encode("utf-8")
+            def _send_json_bytes(self, body: bytes, status: HTTPStatus = HTTPStatus.OK) -> None:
                 self.send_response(status)
                 self.send_header("Content-Type", "application/json")
                 self.send_header("Content-Length", str(len(body)))
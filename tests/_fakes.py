@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+
+class DummyAI:
+    """Stand-in for OrbOpenAIClient in run() tests.
+
+    ``fail_step`` names the call ("transcribe", "chat" or "tts") that should raise;
+    ``transcripts`` are returned in order by transcribe(), otherwise it hears "hello orb".
+    Every message list sent to chat_stream() is kept in ``chat_messages``.
+    """
+
+    def __init__(self, fail_step: str | None = None, transcripts: list[str] | None = None) -> None:
+        self.fail_step = fail_step
+        self._transcripts = transcripts
+        self.chat_messages: list[list[dict[str, str]]] = []
+
+    def transcribe(self, _wav_path: str, _model: str) -> str:
+        if self.fail_step == "transcribe":
+            raise RuntimeError("transcribe boom")
+        if self._transcripts is not None:
+            return self._transcripts.pop(0)
+        return "hello orb"
+
+    def chat_stream(self, messages: list[dict[str, str]], model: str) -> Iterator[str]:
+        if self.fail_step == "chat":
+            raise RuntimeError("chat boom")
+        self.chat_messages.append(messages)
+        return iter(["hello ", "back"])
+
+    def tts_stream(self, _reply: str, _model: str, sink) -> None:
+        if self.fail_step == "tts":
+            raise RuntimeError("tts boom")
+        sink.write(b"mp3")
+
+    def close(self) -> None:
+        return None
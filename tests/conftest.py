@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+
+# Avoid requiring native PortAudio during test collection.
+sys.modules.setdefault("sounddevice", SimpleNamespace())
+
+
+@pytest.fixture(scope="session")
+def orb_main() -> ModuleType:
+    return importlib.import_module("orb.main")
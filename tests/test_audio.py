@@ -1,18 +1,22 @@
 from __future__ import annotations
 
 import importlib
+import json
+import socket
 import sys
+import threading
+import time
 from pathlib import Path
 from types import SimpleNamespace
 
 import numpy as np
+import pytest
 import soundfile as sf
 
 
-# Avoid requiring native PortAudio during test collection.
-sys.modules.setdefault("sounddevice", SimpleNamespace())
-
-AudioIO = importlib.import_module("orb.audio").AudioIO
+audio_module = importlib.import_module("orb.audio")
+AmbientPlayer = audio_module.AmbientPlayer
+AudioIO = audio_module.AudioIO
 
 
 def test_rms_from_audio_file_returns_non_empty_normalized_values(tmp_path: Path) -> None:
@@ -29,3 +33,222 @@ def test_rms_from_audio_file_returns_non_empty_normalized_values(tmp_path: Path)
     assert values
     assert all(0.0 <= value <= 1.0 for value in values)
     assert any(value > 0.0 for value in values)
+
+
+def test_downmix_energy_writes_mono_and_matches_reference() -> None:
+    rng = np.random.default_rng(0)
+    data = rng.uniform(-0.5, 0.5, size=(256, 2)).astype(np.float32)
+    out = np.empty(256, dtype=np.float32)
+
+    mono, energy = audio_module._downmix_energy(data, out)
+
+    expected_mono = data.mean(axis=1)
+    assert np.shares_memory(mono, out)
+    np.testing.assert_allclose(mono, expected_mono, rtol=1e-6)
+    assert energy == pytest.approx(float(np.mean(np.square(expected_mono))), rel=1e-5)
+
+
+def test_downmix_energy_single_channel_returns_view() -> None:
+    data = np.linspace(-0.25, 0.25, 128, dtype=np.float32).reshape(-1, 1)
+    out = np.empty(128, dtype=np.float32)
+
+    mono, energy = audio_module._downmix_energy(data, out)
+
+    assert np.shares_memory(mono, data)
+    assert energy == pytest.approx(float(np.mean(np.square(data))), rel=1e-5)
+
+
+def test_rms_from_audio_file_windows_match_whole_file_reference(tmp_path: Path) -> None:
+    sample_rate = 8000
+    rng = np.random.default_rng(1)
+    signal = rng.uniform(-0.05, 0.05, size=(1003, 2))
+
+    audio_path = tmp_path / "stereo.wav"
+    sf.write(audio_path, signal, sample_rate, subtype="FLOAT")
+
+    values = AudioIO.rms_from_audio_file(str(audio_path), sample_count=10)
+
+    mono = signal.mean(axis=1)
+    window = len(mono) // 10
+    expected = [
+        min(1.0, float(np.sqrt(np.mean(np.square(mono[i : i + window])) + 1e-12) * 8.0))
+        for i in range(0, len(mono), window)
+    ]
+    assert values == pytest.approx(expected, rel=1e-4)
+
+
+class _FakeInputStream:
+    """Feeds blocks to the stream callback from a thread, paced like a real input device."""
+
+    def __init__(self, blocks: list[np.ndarray], callback, **_kwargs) -> None:
+        self._blocks = blocks
+        self._callback = callback
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        for block in self._blocks:
+            if self._stop.wait(0.002):
+                return
+            self._callback(block, len(block), None, None)
+
+    def __enter__(self) -> "_FakeInputStream":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+@pytest.mark.parametrize("channels", [1, 2])
+def test_record_until_stop_stops_on_silence_and_writes_mono(monkeypatch: pytest.MonkeyPatch, channels: int) -> None:
+    sample_rate = 1000
+    blocksize = 100
+    loud = np.full((blocksize, channels), 0.5, dtype=np.float32)
+    quiet = np.zeros((blocksize, channels), dtype=np.float32)
+    blocks = [loud] * 12 + [quiet] * 10
+    monkeypatch.setitem(
+        sys.modules,
+        "sounddevice",
+        SimpleNamespace(InputStream=lambda **kwargs: _FakeInputStream(blocks, **kwargs)),
+    )
+
+    audio = AudioIO(sample_rate=sample_rate, channels=channels, blocksize=blocksize)
+    result = audio.record_until_stop(silence_seconds=0.3, max_record_seconds=5.0, threshold_multiplier=0.5)
+
+    try:
+        data, sr = sf.read(result.wav_path, dtype="float32")
+        assert sr == sample_rate
+        assert data.ndim == 1
+        assert len(data) == int(result.seconds * sample_rate)
+        assert 12 * blocksize < len(data) < len(blocks) * blocksize
+        np.testing.assert_allclose(data[: 12 * blocksize], 0.5)
+        np.testing.assert_allclose(data[12 * blocksize :], 0.0)
+    finally:
+        AudioIO.cleanup_file(result.wav_path)
+
+
+class _IPCListener:
+    def __init__(self, socket_path: Path) -> None:
+        self.received = bytearray()
+        self.connections = 0
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(str(socket_path))
+        self._server.listen()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            with conn:
+                while chunk := conn.recv(4096):
+                    self.received.extend(chunk)
+
+    def messages(self) -> list[dict]:
+        return [json.loads(line) for line in self.received.decode("utf-8").splitlines()]
+
+    def close(self) -> None:
+        self._server.close()
+
+
+def _wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_ambient_set_volume_sends_mpv_property_command(tmp_path: Path) -> None:
+    socket_path = tmp_path / "mpv.sock"
+    listener = _IPCListener(socket_path)
+    player = AmbientPlayer(
+        loop_path=str(tmp_path / "loop.ogg"),
+        socket_path=str(socket_path),
+        initial_volume=20,
+        fade_step=1,
+        fade_interval=0.0,
+    )
+
+    try:
+        player._set_volume(7)
+        player.stop()
+        _wait_until(lambda: listener.received.endswith(b"\n"))
+    finally:
+        listener.close()
+
+    assert listener.messages() == [{"command": ["set_property", "volume", 7]}]
+    assert player.volume == 7
+
+
+def test_ambient_ipc_reuses_connection_and_reconnects_after_drop(tmp_path: Path) -> None:
+    socket_path = tmp_path / "mpv.sock"
+    listener = _IPCListener(socket_path)
+    player = AmbientPlayer(
+        loop_path=str(tmp_path / "loop.ogg"),
+        socket_path=str(socket_path),
+        initial_volume=20,
+        fade_step=1,
+        fade_interval=0.0,
+    )
+
+    try:
+        for vol in (10, 11, 12):
+            assert player._ipc_bytes(b'{"command": ["set_property", "volume", %d]}\n' % vol)
+        _wait_until(lambda: listener.connections == 1)
+        assert listener.connections == 1
+
+        assert player._sock is not None
+        player._sock.shutdown(socket.SHUT_RDWR)
+        assert player._ipc_bytes(b'{"command": ["set_property", "volume", 13]}\n')
+        _wait_until(lambda: listener.connections == 2)
+        assert listener.connections == 2
+    finally:
+        player.stop()
+        listener.close()
+
+
+def test_ambient_fade_coalesces_short_ticks(tmp_path: Path) -> None:
+    socket_path = tmp_path / "mpv.sock"
+    listener = _IPCListener(socket_path)
+    player = AmbientPlayer(
+        loop_path=str(tmp_path / "loop.ogg"),
+        socket_path=str(socket_path),
+        initial_volume=40,
+        fade_step=1,
+        fade_interval=0.001,
+    )
+
+    try:
+        player.fade_to(0)
+        player.stop()
+        _wait_until(lambda: listener.received.endswith(b" 0]}\n"))
+    finally:
+        listener.close()
+
+    volumes = [message["command"][2] for message in listener.messages()]
+    assert volumes[-1] == 0
+    assert len(volumes) < 40
+    assert volumes == sorted(volumes, reverse=True)
+    assert player.volume == 0
+
+
+def test_capture_buffers_reuse_slots_and_drop_when_consumer_lags() -> None:
+    buffers = audio_module._CaptureBuffers(blocksize=4, channels=1, slots=4)
+    blocks = [np.full((4, 1), float(i), dtype=np.float32) for i in range(4)]
+
+    for block in blocks[:3]:
+        buffers.callback(block, len(block), None, None)
+
+    assert buffers.dropped == 1
+    first = buffers.next_block()
+    np.testing.assert_array_equal(first, blocks[0])
+
+    buffers.callback(blocks[3], 4, None, None)
+    np.testing.assert_array_equal(buffers.next_block(), blocks[1])
+    np.testing.assert_array_equal(buffers.next_block(), blocks[3])
+    assert buffers.dropped == 1
@@ -1,53 +1,59 @@
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 
 import pytest
+import yaml
 
 from orb.config import ConfigError, OrbConfig, load_config
 
 
+# Shared by every test; tests that mutate their config take a _valid_config_dict() copy.
+_TEMPLATE: dict = {
+    "stop_keyword": "stop",
+    "ambient_volume_normal": 20,
+    "ambient_volume_ducked": 6,
+    "silence_seconds": 1.2,
+    "max_record_seconds": 10,
+    "gpio_pin_touch": 17,
+    "led_count": 16,
+    "led_pin": 18,
+    "led_brightness": 0.35,
+    "chat_system_prompt": "You are Orb.",
+    "models": {
+        "transcribe": "gpt-4o-mini-transcribe",
+        "chat": "gpt-4o-mini",
+        "tts": "gpt-4o-mini-tts",
+    },
+    "wake_word": {
+        "enabled": False,
+        "keyword": "orb",
+        "engine": "mock",
+        "allow_touch": True,
+    },
+    "paths": {
+        "ambient_loop": "assets/ambient_loop.ogg",
+        "glass_chime": "assets/glass_chime.wav",
+        "down_chime": "assets/down_chime.wav",
+        "mpv_socket": "/tmp/mpv.sock",
+    },
+}
+
+
 def _valid_config_dict() -> dict:
-    return {
-        "stop_keyword": "stop",
-        "ambient_volume_normal": 20,
-        "ambient_volume_ducked": 6,
-        "silence_seconds": 1.2,
-        "max_record_seconds": 10,
-        "gpio_pin_touch": 17,
-        "led_count": 16,
-        "led_pin": 18,
-        "led_brightness": 0.35,
-        "chat_system_prompt": "You are Orb.",
-        "models": {
-            "transcribe": "gpt-4o-mini-transcribe",
-            "chat": "gpt-4o-mini",
-            "tts": "gpt-4o-mini-tts",
-        },
-        "wake_word": {
-            "enabled": False,
-            "keyword": "orb",
-            "engine": "mock",
-            "allow_touch": True,
-        },
-        "paths": {
-            "ambient_loop": "assets/ambient_loop.ogg",
-            "glass_chime": "assets/glass_chime.wav",
-            "down_chime": "assets/down_chime.wav",
-            "tts_output": "tmp/tts.mp3",
-            "mpv_socket": "/tmp/mpv.sock",
-        },
-    }
+    return copy.deepcopy(_TEMPLATE)
 
 
 def test_orb_config_from_dict_valid_config() -> None:
-    config = OrbConfig.from_dict(_valid_config_dict())
+    config = OrbConfig.from_dict(_TEMPLATE)
 
     assert config.stop_keyword == "stop"
     assert config.ambient_volume_normal == 20
     assert config.models.chat == "gpt-4o-mini"
     assert config.paths.glass_chime.endswith("glass_chime.wav")
     assert config.wake_word.engine == "mock"
+    assert config.paths.tts_output is None
 
 
 def test_load_config_valid_yaml(tmp_path: Path) -> None:
@@ -91,6 +97,8 @@ paths:
     assert config.models.transcribe == "gpt-4o-mini-transcribe"
     assert config.wake_word.enabled is True
     assert config.wake_word.allow_touch is False
+    # Deprecated but still accepted so existing configs keep loading.
+    assert config.paths.tts_output == "tmp/tts.mp3"
 
 
 @pytest.mark.parametrize(
@@ -139,7 +147,7 @@ def test_orb_config_from_dict_invalid_wake_word_sensitivity() -> None:
 
 
 def test_orb_config_conversation_defaults() -> None:
-    config = OrbConfig.from_dict(_valid_config_dict())
+    config = OrbConfig.from_dict(_TEMPLATE)
 
     assert config.conversation.enabled is False
     assert config.conversation.max_turns == 6
@@ -162,7 +170,7 @@ def test_orb_config_conversation_values() -> None:
 
 
 def test_orb_config_web_defaults() -> None:
-    config = OrbConfig.from_dict(_valid_config_dict())
+    config = OrbConfig.from_dict(_TEMPLATE)
 
     assert config.web.enabled is False
     assert config.web.host == "127.0.0.1"
@@ -41,3 +41,14 @@ def test_conversation_resets_after_inactivity() -> None:
 
     assert reset is True
     assert buffer.turns == []
+
+
+def test_conversation_inactivity_timeout_boundaries() -> None:
+    buffer = ConversationBuffer(max_turns=4, reset_timeout_seconds=2.5)
+
+    buffer.add_turn("hello", "hi", now=100.0)
+
+    assert buffer.maybe_reset_for_inactivity(now=102.4) is False
+    assert buffer.turns != []
+    assert buffer.maybe_reset_for_inactivity(now=102.5) is True
+    assert buffer.turns == []
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from orb.gpio import KeyboardWakeWordInput, NullWakeWordInput, build_wake_word_input
+import os
+import sys
+import threading
+
+import pytest
+
+from orb.gpio import KeyboardTouchInput, KeyboardWakeWordInput, NullWakeWordInput, build_wake_word_input
 
 
 def test_build_wake_word_input_disabled_returns_null() -> None:
@@ -15,7 +21,55 @@ def test_build_wake_word_input_mock_dry_run() -> None:
     assert isinstance(wake, KeyboardWakeWordInput)
 
 
+def test_build_wake_word_input_mock_engine_without_dry_run() -> None:
+    wake = build_wake_word_input(enabled=True, dry_run=False, keyword="orb", engine="Mock")
+
+    assert isinstance(wake, KeyboardWakeWordInput)
+
+
 def test_build_wake_word_input_unimplemented_engine_returns_null() -> None:
     wake = build_wake_word_input(enabled=True, dry_run=False, keyword="orb", engine="porcupine")
 
     assert isinstance(wake, NullWakeWordInput)
+
+
+def test_keyboard_touch_input_triggers_on_enter_and_stops_promptly(monkeypatch: pytest.MonkeyPatch) -> None:
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd, "r") as fake_stdin, os.fdopen(write_fd, "w") as writer:
+        monkeypatch.setattr(sys, "stdin", fake_stdin)
+        touched = threading.Event()
+        touch = KeyboardTouchInput()
+        touch.start(touched.set)
+
+        writer.write("\n")
+        writer.flush()
+
+        assert touched.wait(timeout=2.0)
+        touch.stop()
+        assert touch._thread is not None
+        assert not touch._thread.is_alive()
+
+
+def test_keyboard_wake_word_input_matches_keyword_and_stops_promptly(monkeypatch: pytest.MonkeyPatch) -> None:
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd, "r") as fake_stdin, os.fdopen(write_fd, "w") as writer:
+        monkeypatch.setattr(sys, "stdin", fake_stdin)
+        triggers: list[str] = []
+        triggered = threading.Event()
+        wake = KeyboardWakeWordInput(keyword="Orb")
+
+        def on_wake() -> None:
+            triggers.append("wake")
+            triggered.set()
+
+        wake.start(on_wake)
+        writer.write("hello\n")
+        writer.flush()
+        writer.write(" orb \n")
+        writer.flush()
+
+        assert triggered.wait(timeout=2.0)
+        wake.stop()
+        assert wake._thread is not None
+        assert not wake._thread.is_alive()
+        assert triggers == ["wake"]
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import math
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from orb import leds as leds_module
+from orb.leds import LedConfig, OrbLEDController
+from orb.state import OrbState
+
+
+def _color(red: int, green: int, blue: int) -> int:
+    return (red << 16) | (green << 8) | blue
+
+
+class _FakeStrip:
+    def __init__(self, num: int, **_kwargs) -> None:
+        self.pixels = [0] * num
+        self.shows = 0
+
+    def begin(self) -> None:
+        return None
+
+    def setPixelColor(self, idx: int, color: int) -> None:  # noqa: N802
+        self.pixels[idx] = color
+
+    def show(self) -> None:
+        self.shows += 1
+
+
+@pytest.fixture
+def controller(monkeypatch: pytest.MonkeyPatch) -> OrbLEDController:
+    monkeypatch.setitem(sys.modules, "rpi_ws281x", SimpleNamespace(PixelStrip=_FakeStrip, Color=_color))
+    return OrbLEDController(LedConfig(count=12, pin=18, brightness=0.5, dma=10, freq_hz=800000, invert=False))
+
+
+def test_ambient_frame_matches_per_pixel_formula(controller: OrbLEDController) -> None:
+    t = 1.37
+    controller._ambient_frame(t)
+
+    expected = []
+    for i in range(12):
+        ripple = 0.5 + 0.5 * math.sin((i / 12) * math.tau + t * 0.8)
+        expected.append(_color(int(2 + 8 * ripple), int(22 + 25 * ripple), int(26 + 40 * ripple)))
+    assert controller._pixels.pixels == expected
+    assert controller._pixels.shows == 1
+
+
+def test_speaking_frame_scales_with_level(controller: OrbLEDController) -> None:
+    t = 0.4
+    controller.set_speaking_level(0.5)
+    controller._speaking_frame(t)
+
+    amplitude = 0.2 + 0.8 * 0.5
+    expected = []
+    for i in range(12):
+        wave = 0.5 + 0.5 * math.sin((i / 12) * math.tau - t * 4.5)
+        intensity = (0.25 + 0.75 * wave) * amplitude
+        expected.append(_color(int(6 * intensity), int(40 * intensity), int(56 * intensity)))
+    assert controller._pixels.pixels == expected
+
+
+@pytest.mark.parametrize(("speed", "t"), [(0.8, 2.5), (-4.5, 3.1), (-4.5, 5_000_000.0)])
+def test_sine_wave_lookup_tracks_sin(controller: OrbLEDController, speed: float, t: float) -> None:
+    wave = controller._sine_wave(speed, t)
+
+    phases = [(i / 12) * math.tau + speed * t for i in range(12)]
+    assert max(abs(w - math.sin(p)) for w, p in zip(wave.tolist(), phases)) < 0.01
+
+
+def test_fill_sets_every_pixel(controller: OrbLEDController) -> None:
+    controller._fill(6, 10, 12)
+
+    assert controller._pixels.pixels == [_color(6, 10, 12)] * 12
+
+
+def test_animation_thread_renders_and_stops_promptly(controller: OrbLEDController) -> None:
+    controller.start()
+    deadline = time.monotonic() + 2.0
+    while controller._pixels.shows == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    started = time.monotonic()
+    controller.stop()
+
+    assert time.monotonic() - started < 0.5
+    assert controller._thread is not None
+    assert not controller._thread.is_alive()
+    assert controller._pixels.pixels == [0] * 12
+
+
+def test_state_change_wakes_slow_static_refresh(controller: OrbLEDController, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(leds_module, "_STATIC_FRAME_INTERVAL_S", 30.0)
+    controller.set_state(OrbState.PROCESSING)
+    controller.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while controller._pixels.shows == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert controller._pixels.pixels == [_color(6, 10, 12)] * 12
+
+        controller.set_state(OrbState.ERROR)
+        deadline = time.monotonic() + 0.5
+        while controller._pixels.pixels == [_color(6, 10, 12)] * 12 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert controller._pixels.pixels != [_color(6, 10, 12)] * 12
+    finally:
+        controller.stop()
+
+
+def test_unchanged_frames_skip_show(controller: OrbLEDController) -> None:
+    controller._fill(6, 10, 12)
+    controller._fill(6, 10, 12)
+    assert controller._pixels.shows == 1
+
+    controller._error_frame(0.0)
+    controller._error_frame(0.1)
+    assert controller._pixels.shows == 2
+
+    controller._error_frame(0.2)
+    assert controller._pixels.shows == 3
+
+    controller.set_speaking_level(0.0)
+    controller._speaking_frame(0.5)
+    controller._speaking_frame(0.5)
+    assert controller._pixels.shows == 4
+
+    controller._fill(6, 10, 12)
+    assert controller._pixels.shows == 5
+    assert controller._pixels.pixels == [_color(6, 10, 12)] * 12
+
+
+def test_queued_speaking_levels_follow_playback_clock(controller: OrbLEDController) -> None:
+    controller.queue_speaking_levels([0.1, 0.9, 0.4], hz=10.0, start=time.monotonic() - 0.15)
+    controller._speaking_frame(0.0)
+    assert controller._speak_level == pytest.approx(0.9)
+
+    controller.queue_speaking_levels([0.1, 0.9, 0.4], hz=10.0, start=time.monotonic() - 5.0)
+    controller._speaking_frame(0.0)
+    assert controller._speak_level == pytest.approx(0.4)
+
+    # A freshly queued envelope starts reading from its first window again.
+    controller.queue_speaking_levels([0.3, 0.6], hz=10.0, start=time.monotonic() + 5.0)
+    controller._speaking_frame(0.0)
+    assert controller._speak_level == pytest.approx(0.3)
+
+    controller.clear_speaking_levels()
+    controller._speaking_frame(0.0)
+    assert controller._speak_level == 0.0
+
+
+def test_clearing_speaking_levels_wakes_slow_speaking_refresh(controller: OrbLEDController, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(leds_module._FRAME_INTERVALS_S, OrbState.SPEAKING, 30.0)
+    controller.set_state(OrbState.SPEAKING)
+    controller.queue_speaking_levels([1.0] * 100, hz=1.0)
+    controller.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while controller._pixels.shows == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        loud = list(controller._pixels.pixels)
+
+        controller.clear_speaking_levels()
+        deadline = time.monotonic() + 0.5
+        while controller._pixels.pixels == loud and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert controller._pixels.pixels != loud
+        assert controller._speak_level == 0.0
+    finally:
+        controller.stop()
@@ -1,21 +1,21 @@
 from __future__ import annotations
 
-import importlib
-import sys
-from types import SimpleNamespace
+import io
+import time
+from dataclasses import dataclass
+from types import ModuleType, SimpleNamespace
+from typing import Iterator
 
 import pytest
 
+from tests._fakes import DummyAI
 
-# Avoid requiring native PortAudio during test collection.
-sys.modules.setdefault("sounddevice", SimpleNamespace())
-
-main = importlib.import_module("orb.main")
 
+class _FixedIterationsEvent:
+    """Event stand-in whose wait() returns ``iterations`` times, then ends run() via KeyboardInterrupt."""
 
-class _OneShotEvent:
-    def __init__(self) -> None:
-        self._wait_calls = 0
+    def __init__(self, iterations: int) -> None:
+        self._waits = iter(range(iterations))
 
     def is_set(self) -> bool:
         return False
@@ -24,14 +24,18 @@ class _OneShotEvent:
         return None
 
     def wait(self) -> None:
-        self._wait_calls += 1
-        if self._wait_calls > 1:
+        if next(self._waits, None) is None:
             raise KeyboardInterrupt
 
     def clear(self) -> None:
         return None
 
 
+class _OneShotEvent(_FixedIterationsEvent):
+    def __init__(self) -> None:
+        super().__init__(iterations=1)
+
+
 class _DummyTouch:
     def __init__(self) -> None:
         self.started = False
@@ -82,6 +86,14 @@ class _DummyLEDs:
         return None
 
 
+@dataclass(slots=True, frozen=True)
+class _Recording:
+    wav_path: str
+
+
+_RECORDING = _Recording("/tmp/orb-recording.wav")
+
+
 class _DummyAudio:
     def __init__(self) -> None:
         self.cleanup_calls: list[str] = []
@@ -90,40 +102,19 @@ class _DummyAudio:
         return None
 
     def record_until_stop(self, **_kwargs):
-        return SimpleNamespace(wav_path="/tmp/orb-recording.wav")
+        return _RECORDING
 
     def cleanup_file(self, path: str) -> None:
         self.cleanup_calls.append(path)
 
 
-class _DummyAI:
-    def __init__(self, fail_step: str) -> None:
-        self.fail_step = fail_step
-
-    def transcribe(self, _wav_path: str, _model: str) -> str:
-        if self.fail_step == "transcribe":
-            raise RuntimeError("transcribe boom")
-        return "hello orb"
-
-    def chat(self, _messages, model: str) -> str:
-        if self.fail_step == "chat":
-            raise RuntimeError("chat boom")
-        return "hello back"
-
-    def tts(self, _reply: str, _model: str, _output_path: str) -> str:
-        if self.fail_step == "tts":
-            raise RuntimeError("tts boom")
-        return "/tmp/reply.mp3"
-
-
-@pytest.mark.parametrize("fail_step", ["transcribe", "chat", "tts"])
-def test_run_cleans_up_recording_when_interaction_raises(monkeypatch: pytest.MonkeyPatch, tmp_path, fail_step: str) -> None:
-    audio = _DummyAudio()
-
-    cfg = SimpleNamespace(
+@pytest.fixture
+def base_cfg(tmp_path) -> SimpleNamespace:
+    """A fresh, fully populated config for run(); tests override only what they exercise."""
+    return SimpleNamespace(
         dry_run=SimpleNamespace(enabled=True),
         paths=SimpleNamespace(
-            tts_output=str(tmp_path / "tts" / "reply.mp3"),
+            tts_output=None,
             glass_chime="glass.wav",
             down_chime="down.wav",
             ambient_loop="ambient.ogg",
@@ -155,19 +146,38 @@ def test_run_cleans_up_recording_when_interaction_raises(monkeypatch: pytest.Mon
         web=SimpleNamespace(enabled=False, host="127.0.0.1", port=8765),
     )
 
+
+def _fake_stream_tts(ai, sentences, model: str, _leds, on_first_sentence=None) -> None:
+    from orb.main import SpeechOutputError
+
+    for sentence in sentences:
+        if on_first_sentence is not None:
+            on_first_sentence()
+            on_first_sentence = None
+        try:
+            ai.tts_stream(sentence, model, io.BytesIO())
+        except RuntimeError as exc:
+            raise SpeechOutputError(str(exc)) from exc
+
+
+@pytest.mark.parametrize("fail_step", ["transcribe", "chat", "tts"])
+def test_run_cleans_up_recording_when_interaction_raises(orb_main: ModuleType, monkeypatch: pytest.MonkeyPatch, base_cfg: SimpleNamespace, fail_step: str) -> None:
+    audio = _DummyAudio()
+
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    monkeypatch.setattr(main.argparse.ArgumentParser, "parse_args", lambda self: SimpleNamespace(config="x", dry_run=True))
-    monkeypatch.setattr(main, "load_config", lambda _path: cfg)
-    monkeypatch.setattr(main.threading, "Event", _OneShotEvent)
-    monkeypatch.setattr(main, "build_touch_input", lambda **_kwargs: _DummyTouch())
-    monkeypatch.setattr(main, "build_wake_word_input", lambda **_kwargs: _DummyTouch())
-    monkeypatch.setattr(main, "AmbientPlayer", lambda **_kwargs: _DummyAmbient())
-    monkeypatch.setattr(main, "AudioIO", lambda **_kwargs: audio)
-    monkeypatch.setattr(main, "OrbOpenAIClient", lambda: _DummyAI(fail_step=fail_step))
-    monkeypatch.setattr(main, "OrbLEDController", lambda *_args, **_kwargs: _DummyLEDs())
-    monkeypatch.setattr(main, "play_with_led_sync", lambda *_args, **_kwargs: None)
-
-    main.run()
+    monkeypatch.setattr(orb_main.argparse.ArgumentParser, "parse_args", lambda self: SimpleNamespace(config="x", dry_run=True))
+    monkeypatch.setattr(orb_main, "load_config", lambda _path: base_cfg)
+    monkeypatch.setattr(orb_main.threading, "Event", _OneShotEvent)
+    monkeypatch.setattr(orb_main, "build_touch_input", lambda **_kwargs: _DummyTouch())
+    monkeypatch.setattr(orb_main, "build_wake_word_input", lambda **_kwargs: _DummyTouch())
+    monkeypatch.setattr(orb_main, "AmbientPlayer", lambda **_kwargs: _DummyAmbient())
+    monkeypatch.setattr(orb_main, "AudioIO", lambda **_kwargs: audio)
+    monkeypatch.setattr(orb_main, "OrbOpenAIClient", lambda: DummyAI(fail_step=fail_step))
+    monkeypatch.setattr(orb_main, "OrbLEDController", lambda *_args, **_kwargs: _DummyLEDs())
+    monkeypatch.setattr(orb_main, "play_with_led_sync", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(orb_main, "stream_tts_with_led_sync", _fake_stream_tts)
+
+    orb_main.run()
 
     assert audio.cleanup_calls == ["/tmp/orb-recording.wav"]
 
@@ -180,116 +190,183 @@ def test_run_cleans_up_recording_when_interaction_raises(monkeypatch: pytest.Mon
         (True, True, ["touch", "wake"]),
     ],
 )
-def test_run_selects_trigger_sources(monkeypatch: pytest.MonkeyPatch, tmp_path, wake_enabled: bool, allow_touch: bool, expected: list[str]) -> None:
+def test_run_selects_trigger_sources(orb_main: ModuleType, monkeypatch: pytest.MonkeyPatch, base_cfg: SimpleNamespace, wake_enabled: bool, allow_touch: bool, expected: list[str]) -> None:
     started: list[str] = []
 
-    cfg = SimpleNamespace(
-        dry_run=SimpleNamespace(enabled=True),
-        paths=SimpleNamespace(
-            tts_output=str(tmp_path / "tts" / "reply.mp3"),
-            glass_chime="glass.wav",
-            down_chime="down.wav",
-            ambient_loop="ambient.ogg",
-            mpv_socket=str(tmp_path / "mpv.sock"),
-        ),
-        led_count=16,
-        led_pin=18,
-        led_brightness=0.2,
-        led_dma=10,
-        led_freq_hz=800000,
-        led_invert=False,
-        gpio_pin_touch=17,
-        touch_bounce_seconds=0.05,
-        ambient_volume_normal=20,
-        ambient_volume_ducked=6,
-        ambient_fade_step=1,
-        ambient_fade_interval=0.01,
-        record_sample_rate=16000,
-        record_channels=1,
-        record_blocksize=1024,
-        silence_seconds=1.0,
-        max_record_seconds=4.0,
-        silence_threshold_multiplier=1.3,
-        stop_keyword="stop",
-        chat_system_prompt="You are Orb.",
-        models=SimpleNamespace(transcribe="m1", chat="m2", tts="m3"),
-        wake_word=SimpleNamespace(enabled=wake_enabled, keyword="orb", engine="mock", allow_touch=allow_touch),
-        conversation=SimpleNamespace(enabled=False, max_turns=6, reset_timeout_seconds=None),
-        web=SimpleNamespace(enabled=False, host="127.0.0.1", port=8765),
-    )
+    base_cfg.wake_word.enabled = wake_enabled
+    base_cfg.wake_word.allow_touch = allow_touch
 
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    monkeypatch.setattr(main.argparse.ArgumentParser, "parse_args", lambda self: SimpleNamespace(config="x", dry_run=True))
-    monkeypatch.setattr(main, "load_config", lambda _path: cfg)
-    monkeypatch.setattr(main.threading, "Event", _OneShotEvent)
-    monkeypatch.setattr(main, "build_touch_input", lambda **_kwargs: _RecordingInput("touch", started))
-    monkeypatch.setattr(main, "build_wake_word_input", lambda **_kwargs: _RecordingInput("wake", started))
-    monkeypatch.setattr(main, "AmbientPlayer", lambda **_kwargs: _DummyAmbient())
-    monkeypatch.setattr(main, "AudioIO", lambda **_kwargs: _DummyAudio())
-    monkeypatch.setattr(main, "OrbOpenAIClient", lambda: _DummyAI(fail_step="none"))
-    monkeypatch.setattr(main, "OrbLEDController", lambda *_args, **_kwargs: _DummyLEDs())
-    monkeypatch.setattr(main, "play_with_led_sync", lambda *_args, **_kwargs: None)
-
-    main.run()
+    monkeypatch.setattr(orb_main.argparse.ArgumentParser, "parse_args", lambda self: SimpleNamespace(config="x", dry_run=True))
+    monkeypatch.setattr(orb_main, "load_config", lambda _path: base_cfg)
+    monkeypatch.setattr(orb_main.threading, "Event", _OneShotEvent)
+    monkeypatch.setattr(orb_main, "build_touch_input", lambda **_kwargs: _RecordingInput("touch", started))
+    monkeypatch.setattr(orb_main, "build_wake_word_input", lambda **_kwargs: _RecordingInput("wake", started))
+    monkeypatch.setattr(orb_main, "AmbientPlayer", lambda **_kwargs: _DummyAmbient())
+    monkeypatch.setattr(orb_main, "AudioIO", lambda **_kwargs: _DummyAudio())
+    monkeypatch.setattr(orb_main, "OrbOpenAIClient", lambda: DummyAI())
+    monkeypatch.setattr(orb_main, "OrbLEDController", lambda *_args, **_kwargs: _DummyLEDs())
+    monkeypatch.setattr(orb_main, "play_with_led_sync", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(orb_main, "stream_tts_with_led_sync", _fake_stream_tts)
+
+    orb_main.run()
 
     assert started == expected
 
 
-def test_touch_event_deduplicates_triggers() -> None:
-    event = main.threading.Event()
+class _FakeProcess:
+    def __init__(self, cmd, **_kwargs) -> None:
+        self.cmd = cmd
+        self.waited = False
 
-    def on_touch() -> None:
-        if not event.is_set():
-            event.set()
+    def wait(self) -> int:
+        self.waited = True
+        return 0
 
-    on_touch()
-    on_touch()
 
-    assert event.is_set()
+class _ScheduleLEDs(_DummyLEDs):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, object]] = []
 
-class _FixedIterationsEvent:
-    def __init__(self, iterations: int) -> None:
-        self._remaining = iterations
+    def queue_speaking_levels(self, levels) -> None:
+        self.events.append(("queue", list(levels)))
 
-    def is_set(self) -> bool:
-        return False
+    def clear_speaking_levels(self) -> None:
+        self.events.append(("clear", None))
 
-    def set(self) -> None:
-        return None
 
-    def wait(self) -> None:
-        if self._remaining <= 0:
-            raise KeyboardInterrupt
-        self._remaining -= 1
+def test_play_with_led_sync_queues_levels_and_waits_for_playback(orb_main: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    processes: list[_FakeProcess] = []
 
-    def clear(self) -> None:
-        return None
+    def fake_popen(cmd, **kwargs) -> _FakeProcess:
+        proc = _FakeProcess(cmd, **kwargs)
+        processes.append(proc)
+        return proc
 
+    audio = SimpleNamespace(rms_from_audio_file=lambda _path: [0.2, 0.8])
+    leds = _ScheduleLEDs()
+    monkeypatch.setattr(orb_main.subprocess, "Popen", fake_popen)
 
-class _SequenceAudio(_DummyAudio):
-    def __init__(self, turns: int) -> None:
-        super().__init__()
-        self._turns = turns
+    orb_main.play_with_led_sync("/tmp/reply.mp3", leds, audio)
+
+    assert processes[0].cmd[-1] == "/tmp/reply.mp3"
+    assert processes[0].waited is True
+    assert leds.events == [("queue", [0.2, 0.8]), ("clear", None)]
+
+
+class _FakeSink:
+    def __init__(self) -> None:
+        self.data = b""
+        self.closed = False
+
+    def write(self, chunk: bytes) -> None:
+        self.data += chunk
+
+    def close(self) -> None:
+        self.closed = True
 
-    def record_until_stop(self, **_kwargs):
-        self._turns -= 1
-        return SimpleNamespace(wav_path=f"/tmp/orb-recording-{self._turns}.wav")
 
+class _StreamingAI:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
 
-class _ConversationAwareAI:
-    def __init__(self, transcripts: list[str]) -> None:
-        self._transcripts = transcripts
-        self.chat_messages: list[list[dict[str, str]]] = []
+    def tts_stream(self, text: str, _model: str, sink) -> None:
+        if self.error is not None and text == "Second.":
+            raise self.error
+        sink.write(text.encode())
 
-    def transcribe(self, _wav_path: str, _model: str) -> str:
-        return self._transcripts.pop(0)
 
-    def chat(self, messages, model: str) -> str:
-        self.chat_messages.append(messages)
-        return "reply"
+class _LevelLEDs(_DummyLEDs):
+    def __init__(self) -> None:
+        self.levels: list[float] = []
+
+    def set_speaking_level(self, level: float) -> None:
+        self.levels.append(level)
+
+
+@pytest.mark.parametrize("error", [None, RuntimeError("stream boom")])
+def test_stream_tts_with_led_sync_pipes_sentences_into_mpv_in_order(orb_main: ModuleType, monkeypatch: pytest.MonkeyPatch, error) -> None:
+    processes: list[_FakeProcess] = []
+
+    def fake_popen(cmd, **kwargs) -> _FakeProcess:
+        proc = _FakeProcess(cmd, **kwargs)
+        proc.stdin = _FakeSink()
+        processes.append(proc)
+        return proc
+
+    leds = _LevelLEDs()
+    monkeypatch.setattr(orb_main.subprocess, "Popen", fake_popen)
+
+    if error is None:
+        orb_main.stream_tts_with_led_sync(_StreamingAI(), ["First.", "Second."], "tts-model", leds)
+        assert processes[0].stdin.data == b"First.Second."
+    else:
+        with pytest.raises(RuntimeError, match="stream boom"):
+            orb_main.stream_tts_with_led_sync(_StreamingAI(error), ["First.", "Second."], "tts-model", leds)
+        assert processes[0].stdin.data == b"First."
+
+    assert processes[0].cmd[-1] == "-"
+    assert processes[0].stdin.closed is True
+    assert processes[0].waited is True
+    assert leds.levels == [orb_main._STREAMED_SPEECH_LEVEL, 0.0]
+
+
+def test_stream_tts_with_led_sync_raises_before_generation_finishes(orb_main: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(orb_main.subprocess, "Popen", lambda cmd, **_kwargs: SimpleNamespace(stdin=_FakeSink(), wait=lambda: 0))
+    events: list[str] = []
+    pulled = 0
+
+    def sentences():
+        nonlocal pulled
+        for _ in range(1000):
+            pulled += 1
+            yield "Second."
+            time.sleep(0.001)
+
+    with pytest.raises(RuntimeError, match="stream boom"):
+        orb_main.stream_tts_with_led_sync(
+            _StreamingAI(RuntimeError("stream boom")),
+            sentences(),
+            "tts-model",
+            _LevelLEDs(),
+            on_first_sentence=lambda: events.append("speaking"),
+        )
+
+    assert events == ["speaking"]
+    assert pulled < 1000
+
 
-    def tts(self, _reply: str, _model: str, _output_path: str) -> str:
-        return "/tmp/reply.mp3"
+def test_iter_sentences_yields_complete_sentences_early(orb_main: ModuleType) -> None:
+    parts: list[str] = []
+    seen: list[tuple[str, int]] = []
+
+    for sentence in orb_main.iter_sentences(["Hi the", "re! How ", "are you? I'm", " fine"], parts):
+        seen.append((sentence, len(parts)))
+
+    assert seen == [("Hi there!", 2), ("How are you?", 3), ("I'm fine", 4)]
+    assert "".join(parts) == "Hi there! How are you? I'm fine"
+
+
+def test_touch_event_deduplicates_triggers(orb_main: ModuleType) -> None:
+    event = orb_main.threading.Event()
+
+    def on_touch() -> None:
+        if not event.is_set():
+            event.set()
+
+    on_touch()
+    on_touch()
+
+    assert event.is_set()
+
+class _SequenceAudio(_DummyAudio):
+    def __init__(self, turns: int) -> None:
+        super().__init__()
+        # Popped from the end, so turns are recorded as ...-{turns - 1}.wav down to ...-0.wav.
+        self._recordings = [_Recording(f"/tmp/orb-recording-{i}.wav") for i in range(turns)]
+
+    def record_until_stop(self, **_kwargs):
+        return self._recordings.pop()
 
 
 class _DummyWebServer:
@@ -306,57 +383,26 @@ class _DummyWebServer:
         type(self).stopped += 1
 
 
-def test_run_resets_conversation_on_stop_keyword(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
-    ai = _ConversationAwareAI(["hello", "orb sleep", "hello again"])
+def test_run_resets_conversation_on_stop_keyword(orb_main: ModuleType, monkeypatch: pytest.MonkeyPatch, base_cfg: SimpleNamespace) -> None:
+    ai = DummyAI(transcripts=["hello", "orb sleep", "hello again"])
 
-    cfg = SimpleNamespace(
-        dry_run=SimpleNamespace(enabled=True),
-        paths=SimpleNamespace(
-            tts_output=str(tmp_path / "tts" / "reply.mp3"),
-            glass_chime="glass.wav",
-            down_chime="down.wav",
-            ambient_loop="ambient.ogg",
-            mpv_socket=str(tmp_path / "mpv.sock"),
-        ),
-        led_count=16,
-        led_pin=18,
-        led_brightness=0.2,
-        led_dma=10,
-        led_freq_hz=800000,
-        led_invert=False,
-        gpio_pin_touch=17,
-        touch_bounce_seconds=0.05,
-        ambient_volume_normal=20,
-        ambient_volume_ducked=6,
-        ambient_fade_step=1,
-        ambient_fade_interval=0.01,
-        record_sample_rate=16000,
-        record_channels=1,
-        record_blocksize=1024,
-        silence_seconds=1.0,
-        max_record_seconds=4.0,
-        silence_threshold_multiplier=1.3,
-        stop_keyword="orb sleep",
-        chat_system_prompt="You are Orb.",
-        models=SimpleNamespace(transcribe="m1", chat="m2", tts="m3"),
-        wake_word=SimpleNamespace(enabled=False, keyword="orb", engine="mock", allow_touch=True),
-        conversation=SimpleNamespace(enabled=True, max_turns=6, reset_timeout_seconds=None),
-        web=SimpleNamespace(enabled=False, host="127.0.0.1", port=8765),
-    )
+    base_cfg.stop_keyword = "orb sleep"
+    base_cfg.conversation.enabled = True
 
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    monkeypatch.setattr(main.argparse.ArgumentParser, "parse_args", lambda self: SimpleNamespace(config="x", dry_run=True))
-    monkeypatch.setattr(main, "load_config", lambda _path: cfg)
-    monkeypatch.setattr(main.threading, "Event", lambda: _FixedIterationsEvent(iterations=3))
-    monkeypatch.setattr(main, "build_touch_input", lambda **_kwargs: _DummyTouch())
-    monkeypatch.setattr(main, "build_wake_word_input", lambda **_kwargs: _DummyTouch())
-    monkeypatch.setattr(main, "AmbientPlayer", lambda **_kwargs: _DummyAmbient())
-    monkeypatch.setattr(main, "AudioIO", lambda **_kwargs: _SequenceAudio(turns=3))
-    monkeypatch.setattr(main, "OrbOpenAIClient", lambda: ai)
-    monkeypatch.setattr(main, "OrbLEDController", lambda *_args, **_kwargs: _DummyLEDs())
-    monkeypatch.setattr(main, "play_with_led_sync", lambda *_args, **_kwargs: None)
-
-    main.run()
+    monkeypatch.setattr(orb_main.argparse.ArgumentParser, "parse_args", lambda self: SimpleNamespace(config="x", dry_run=True))
+    monkeypatch.setattr(orb_main, "load_config", lambda _path: base_cfg)
+    monkeypatch.setattr(orb_main.threading, "Event", lambda: _FixedIterationsEvent(iterations=3))
+    monkeypatch.setattr(orb_main, "build_touch_input", lambda **_kwargs: _DummyTouch())
+    monkeypatch.setattr(orb_main, "build_wake_word_input", lambda **_kwargs: _DummyTouch())
+    monkeypatch.setattr(orb_main, "AmbientPlayer", lambda **_kwargs: _DummyAmbient())
+    monkeypatch.setattr(orb_main, "AudioIO", lambda **_kwargs: _SequenceAudio(turns=3))
+    monkeypatch.setattr(orb_main, "OrbOpenAIClient", lambda: ai)
+    monkeypatch.setattr(orb_main, "OrbLEDController", lambda *_args, **_kwargs: _DummyLEDs())
+    monkeypatch.setattr(orb_main, "play_with_led_sync", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(orb_main, "stream_tts_with_led_sync", _fake_stream_tts)
+
+    orb_main.run()
 
     assert len(ai.chat_messages) == 2
     assert ai.chat_messages[1] == [
@@ -365,114 +411,101 @@ def test_run_resets_conversation_on_stop_keyword(monkeypatch: pytest.MonkeyPatch
     ]
 
 
-def test_run_web_lifecycle_when_enabled(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+class _ChatCutOffAI(DummyAI):
+    """Fails partway through the first reply's chat stream, then behaves normally."""
+
+    def chat_stream(self, messages: list[dict[str, str]], model: str) -> Iterator[str]:
+        deltas = super().chat_stream(messages, model)
+        if len(self.chat_messages) == 1:
+            return self._cut_off(deltas)
+        return deltas
+
+    @staticmethod
+    def _cut_off(deltas: Iterator[str]) -> Iterator[str]:
+        yield next(deltas)
+        raise RuntimeError("chat stream boom")
+
+
+@pytest.mark.parametrize(
+    ("make_ai", "history"),
+    [
+        # TTS failed after the reply was generated: the turn is kept.
+        (
+            lambda: DummyAI(fail_step="tts", transcripts=["hello", "hello again"]),
+            [{"role": "user", "content": "hello"}, {"role": "assistant", "content": "hello back"}],
+        ),
+        # The chat stream itself failed: the truncated reply is not recorded.
+        (lambda: _ChatCutOffAI(transcripts=["hello", "hello again"]), []),
+    ],
+    ids=["tts-fails", "chat-fails"],
+)
+def test_run_records_the_turn_only_when_the_reply_was_generated(orb_main: ModuleType, monkeypatch: pytest.MonkeyPatch, base_cfg: SimpleNamespace, make_ai, history: list[dict[str, str]]) -> None:
+    ai = make_ai()
+    base_cfg.conversation.enabled = True
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(orb_main.argparse.ArgumentParser, "parse_args", lambda self: SimpleNamespace(config="x", dry_run=True))
+    monkeypatch.setattr(orb_main, "load_config", lambda _path: base_cfg)
+    monkeypatch.setattr(orb_main.threading, "Event", lambda: _FixedIterationsEvent(iterations=2))
+    monkeypatch.setattr(orb_main, "build_touch_input", lambda **_kwargs: _DummyTouch())
+    monkeypatch.setattr(orb_main, "build_wake_word_input", lambda **_kwargs: _DummyTouch())
+    monkeypatch.setattr(orb_main, "AmbientPlayer", lambda **_kwargs: _DummyAmbient())
+    monkeypatch.setattr(orb_main, "AudioIO", lambda **_kwargs: _SequenceAudio(turns=2))
+    monkeypatch.setattr(orb_main, "OrbOpenAIClient", lambda: ai)
+    monkeypatch.setattr(orb_main, "OrbLEDController", lambda *_args, **_kwargs: _DummyLEDs())
+    monkeypatch.setattr(orb_main, "play_with_led_sync", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(orb_main, "stream_tts_with_led_sync", _fake_stream_tts)
+
+    orb_main.run()
+
+    assert ai.chat_messages[1][1:] == [*history, {"role": "user", "content": "hello again"}]
+
+
+def test_run_web_lifecycle_when_enabled(orb_main: ModuleType, monkeypatch: pytest.MonkeyPatch, base_cfg: SimpleNamespace) -> None:
     _DummyWebServer.started = 0
     _DummyWebServer.stopped = 0
 
-    cfg = SimpleNamespace(
-        dry_run=SimpleNamespace(enabled=True),
-        paths=SimpleNamespace(
-            tts_output=str(tmp_path / "tts" / "reply.mp3"),
-            glass_chime="glass.wav",
-            down_chime="down.wav",
-            ambient_loop="ambient.ogg",
-            mpv_socket=str(tmp_path / "mpv.sock"),
-        ),
-        led_count=16,
-        led_pin=18,
-        led_brightness=0.2,
-        led_dma=10,
-        led_freq_hz=800000,
-        led_invert=False,
-        gpio_pin_touch=17,
-        touch_bounce_seconds=0.05,
-        ambient_volume_normal=20,
-        ambient_volume_ducked=6,
-        ambient_fade_step=1,
-        ambient_fade_interval=0.01,
-        record_sample_rate=16000,
-        record_channels=1,
-        record_blocksize=1024,
-        silence_seconds=1.0,
-        max_record_seconds=4.0,
-        silence_threshold_multiplier=1.3,
-        stop_keyword="stop",
-        chat_system_prompt="You are Orb.",
-        models=SimpleNamespace(transcribe="m1", chat="m2", tts="m3"),
-        wake_word=SimpleNamespace(enabled=False, keyword="orb", engine="mock", allow_touch=True),
-        conversation=SimpleNamespace(enabled=False, max_turns=6, reset_timeout_seconds=None),
-        web=SimpleNamespace(enabled=True, host="127.0.0.1", port=8765),
-    )
+    base_cfg.web.enabled = True
 
-    monkeypatch.setattr(main.argparse.ArgumentParser, "parse_args", lambda self: SimpleNamespace(config="x", dry_run=True))
-    monkeypatch.setattr(main, "load_config", lambda _path: cfg)
-    monkeypatch.setattr(main.threading, "Event", _OneShotEvent)
-    monkeypatch.setattr(main, "build_touch_input", lambda **_kwargs: _DummyTouch())
-    monkeypatch.setattr(main, "build_wake_word_input", lambda **_kwargs: _DummyTouch())
-    monkeypatch.setattr(main, "AmbientPlayer", lambda **_kwargs: _DummyAmbient())
-    monkeypatch.setattr(main, "AudioIO", lambda **_kwargs: _DummyAudio())
-    monkeypatch.setattr(main, "OrbOpenAIClient", lambda: _DummyAI(fail_step="none"))
-    monkeypatch.setattr(main, "OrbLEDController", lambda *_args, **_kwargs: _DummyLEDs())
-    monkeypatch.setattr(main, "play_with_led_sync", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(main, "OrbWebServer", _DummyWebServer)
+    monkeypatch.setattr(orb_main.argparse.ArgumentParser, "parse_args", lambda self: SimpleNamespace(config="x", dry_run=True))
+    monkeypatch.setattr(orb_main, "load_config", lambda _path: base_cfg)
+    monkeypatch.setattr(orb_main.threading, "Event", _OneShotEvent)
+    monkeypatch.setattr(orb_main, "build_touch_input", lambda **_kwargs: _DummyTouch())
+    monkeypatch.setattr(orb_main, "build_wake_word_input", lambda **_kwargs: _DummyTouch())
+    monkeypatch.setattr(orb_main, "AmbientPlayer", lambda **_kwargs: _DummyAmbient())
+    monkeypatch.setattr(orb_main, "AudioIO", lambda **_kwargs: _DummyAudio())
+    monkeypatch.setattr(orb_main, "OrbOpenAIClient", lambda: DummyAI())
+    monkeypatch.setattr(orb_main, "OrbLEDController", lambda *_args, **_kwargs: _DummyLEDs())
+    monkeypatch.setattr(orb_main, "play_with_led_sync", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(orb_main, "stream_tts_with_led_sync", _fake_stream_tts)
+    monkeypatch.setattr(orb_main, "OrbWebServer", _DummyWebServer)
 
-    main.run()
+    orb_main.run()
 
     assert _DummyWebServer.started == 1
     assert _DummyWebServer.stopped == 1
 
 
-def test_run_resets_conversation_on_reset_phrase(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
-    ai = _ConversationAwareAI(["hello", "reset conversation", "hello again"])
+def test_run_resets_conversation_on_reset_phrase(orb_main: ModuleType, monkeypatch: pytest.MonkeyPatch, base_cfg: SimpleNamespace) -> None:
+    ai = DummyAI(transcripts=["hello", "reset conversation", "hello again"])
 
-    cfg = SimpleNamespace(
-        dry_run=SimpleNamespace(enabled=True),
-        paths=SimpleNamespace(
-            tts_output=str(tmp_path / "tts" / "reply.mp3"),
-            glass_chime="glass.wav",
-            down_chime="down.wav",
-            ambient_loop="ambient.ogg",
-            mpv_socket=str(tmp_path / "mpv.sock"),
-        ),
-        led_count=16,
-        led_pin=18,
-        led_brightness=0.2,
-        led_dma=10,
-        led_freq_hz=800000,
-        led_invert=False,
-        gpio_pin_touch=17,
-        touch_bounce_seconds=0.05,
-        ambient_volume_normal=20,
-        ambient_volume_ducked=6,
-        ambient_fade_step=1,
-        ambient_fade_interval=0.01,
-        record_sample_rate=16000,
-        record_channels=1,
-        record_blocksize=1024,
-        silence_seconds=1.0,
-        max_record_seconds=4.0,
-        silence_threshold_multiplier=1.3,
-        stop_keyword="orb sleep",
-        chat_system_prompt="You are Orb.",
-        models=SimpleNamespace(transcribe="m1", chat="m2", tts="m3"),
-        wake_word=SimpleNamespace(enabled=False, keyword="orb", engine="mock", allow_touch=True),
-        conversation=SimpleNamespace(enabled=True, max_turns=6, reset_timeout_seconds=None),
-        web=SimpleNamespace(enabled=False, host="127.0.0.1", port=8765),
-    )
+    base_cfg.stop_keyword = "orb sleep"
+    base_cfg.conversation.enabled = True
 
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    monkeypatch.setattr(main.argparse.ArgumentParser, "parse_args", lambda self: SimpleNamespace(config="x", dry_run=True))
-    monkeypatch.setattr(main, "load_config", lambda _path: cfg)
-    monkeypatch.setattr(main.threading, "Event", lambda: _FixedIterationsEvent(iterations=3))
-    monkeypatch.setattr(main, "build_touch_input", lambda **_kwargs: _DummyTouch())
-    monkeypatch.setattr(main, "build_wake_word_input", lambda **_kwargs: _DummyTouch())
-    monkeypatch.setattr(main, "AmbientPlayer", lambda **_kwargs: _DummyAmbient())
-    monkeypatch.setattr(main, "AudioIO", lambda **_kwargs: _SequenceAudio(turns=3))
-    monkeypatch.setattr(main, "OrbOpenAIClient", lambda: ai)
-    monkeypatch.setattr(main, "OrbLEDController", lambda *_args, **_kwargs: _DummyLEDs())
-    monkeypatch.setattr(main, "play_with_led_sync", lambda *_args, **_kwargs: None)
-
-    main.run()
+    monkeypatch.setattr(orb_main.argparse.ArgumentParser, "parse_args", lambda self: SimpleNamespace(config="x", dry_run=True))
+    monkeypatch.setattr(orb_main, "load_config", lambda _path: base_cfg)
+    monkeypatch.setattr(orb_main.threading, "Event", lambda: _FixedIterationsEvent(iterations=3))
+    monkeypatch.setattr(orb_main, "build_touch_input", lambda **_kwargs: _DummyTouch())
+    monkeypatch.setattr(orb_main, "build_wake_word_input", lambda **_kwargs: _DummyTouch())
+    monkeypatch.setattr(orb_main, "AmbientPlayer", lambda **_kwargs: _DummyAmbient())
+    monkeypatch.setattr(orb_main, "AudioIO", lambda **_kwargs: _SequenceAudio(turns=3))
+    monkeypatch.setattr(orb_main, "OrbOpenAIClient", lambda: ai)
+    monkeypatch.setattr(orb_main, "OrbLEDController", lambda *_args, **_kwargs: _DummyLEDs())
+    monkeypatch.setattr(orb_main, "play_with_led_sync", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(orb_main, "stream_tts_with_led_sync", _fake_stream_tts)
+
+    orb_main.run()
 
     assert len(ai.chat_messages) == 2
     assert ai.chat_messages[1] == [
@@ -1,22 +1,18 @@
 from __future__ import annotations
 
+import io
+import sys
 from types import SimpleNamespace
 
-from orb.openai_client import FALLBACK_ASSISTANT_TEXT, OrbOpenAIClient
-
+import pytest
 
-class _StubCompletions:
-    def __init__(self, response: object) -> None:
-        self._response = response
-
-    def create(self, **_: object) -> object:
-        return self._response
+from orb.openai_client import FALLBACK_ASSISTANT_TEXT, OrbOpenAIClient
 
 
 def _build_client_with_response(response: object) -> OrbOpenAIClient:
     client = OrbOpenAIClient.__new__(OrbOpenAIClient)
     client.client = SimpleNamespace(
-        chat=SimpleNamespace(completions=_StubCompletions(response))
+        chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **_: response))
     )
     return client
 
@@ -81,3 +77,69 @@ def test_chat_uses_fallback_for_none_or_empty_content() -> None:
 
     assert none_result == FALLBACK_ASSISTANT_TEXT
     assert empty_result == FALLBACK_ASSISTANT_TEXT
+
+
+def test_client_construction_defers_sdk_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "openai", None)
+
+    client = OrbOpenAIClient(api_key="test-key")
+
+    with pytest.raises(ImportError):
+        _ = client.client
+
+
+class _StubSpeechResponse:
+    def __enter__(self) -> "_StubSpeechResponse":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def iter_bytes(self):
+        yield b"ID3"
+        yield b"frames"
+
+
+def test_tts_stream_writes_chunks_to_sink() -> None:
+    client = OrbOpenAIClient.__new__(OrbOpenAIClient)
+    client.client = SimpleNamespace(
+        audio=SimpleNamespace(
+            speech=SimpleNamespace(
+                with_streaming_response=SimpleNamespace(create=lambda **_kwargs: _StubSpeechResponse())
+            )
+        )
+    )
+    sink = io.BytesIO()
+
+    client.tts_stream("hello", "tts-model", sink)
+
+    assert sink.getvalue() == b"ID3frames"
+
+
+def test_close_releases_http_client_once() -> None:
+    closed: list[bool] = []
+    client = OrbOpenAIClient(api_key="test-key")
+    client.close()
+
+    client._http = SimpleNamespace(close=lambda: closed.append(True))
+    client.__dict__["client"] = object()
+    client.close()
+    client.close()
+
+    assert closed == [True]
+    assert "client" not in client.__dict__
+
+
+def _stream_chunk(content: object) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+def test_chat_stream_yields_deltas_and_falls_back_when_empty() -> None:
+    streaming = _build_client_with_response(
+        iter([_stream_chunk("Hello"), SimpleNamespace(choices=[]), _stream_chunk(None), _stream_chunk(" there.")])
+    )
+    empty = _build_client_with_response(iter([_stream_chunk("  "), _stream_chunk(None)]))
+    messages = [{"role": "user", "content": "Hi"}]
+
+    assert list(streaming.chat_stream(messages, model="gpt-4o-mini")) == ["Hello", " there."]
+    assert list(empty.chat_stream(messages, model="gpt-4o-mini"))[-1] == FALLBACK_ASSISTANT_TEXT
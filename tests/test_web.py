@@ -1,83 +1,157 @@
 from __future__ import annotations
 
+import http.client
 import json
-import urllib.request
+from http import HTTPStatus
+from typing import Iterator
+
+import pytest
 
 from orb.state import OrbState
 from orb.web import OrbWebServer, OrbWebStatus
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib codec gives the same results.
+    orjson = None
 
-def _json_request(url: str, method: str = "GET", payload: dict | None = None) -> dict:
-    data = json.dumps(payload).encode("utf-8") if payload is not None else None
-    request = urllib.request.Request(
-        url,
-        data=data,
-        method=method,
-        headers={"Content-Type": "application/json"},
-    )
-    with urllib.request.urlopen(request, timeout=2.0) as response:  # noqa: S310
-        return json.loads(response.read().decode("utf-8"))
 
+def _dumps(payload: object) -> bytes:
+    return orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
 
-def test_web_server_endpoints_and_actions() -> None:
-    status = OrbWebStatus(dry_run=True)
-    status.set_state(OrbState.PROCESSING)
-    status.set_ambient_running(True)
-    status.set_last_transcript("hello hello hello " * 20)
-    status.set_last_reply("hi there")
 
-    calls = {"trigger": 0, "reset": 0, "simulation": None}
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_request(server: OrbWebServer, path: str, method: str = "GET", payload: dict | None = None) -> dict:
+    status, body = server.dispatch(method, path, _dumps(payload) if payload is not None else b"")
+    assert status == HTTPStatus.OK
+    return _loads(body)
+
 
+@pytest.fixture(scope="module")
+def _web_server() -> Iterator[tuple[OrbWebServer, dict]]:
+    calls: dict = {}
     server = OrbWebServer(
         host="127.0.0.1",
         port=0,
-        status=status,
+        status=OrbWebStatus(dry_run=True),
         trigger_interaction=lambda: calls.__setitem__("trigger", calls["trigger"] + 1),
         reset_conversation=lambda: calls.__setitem__("reset", calls["reset"] + 1),
         set_simulation_enabled=lambda enabled: calls.__setitem__("simulation", enabled),
     )
-
     server.start()
+    try:
+        yield server, calls
+    finally:
+        server.stop()
+
+
+@pytest.fixture
+def web(_web_server: tuple[OrbWebServer, dict]) -> tuple[OrbWebServer, OrbWebStatus, dict]:
+    # The server is shared across the module; each test gets a fresh status and zeroed calls.
+    server, calls = _web_server
+    server._status = OrbWebStatus(dry_run=True)
+    calls.update(trigger=0, reset=0, simulation=None)
+    return server, server._status, calls
+
+
+def _connect(server: OrbWebServer) -> http.client.HTTPConnection:
     assert server._httpd is not None
-    base = f"http://127.0.0.1:{server._httpd.server_port}"
+    return http.client.HTTPConnection("127.0.0.1", server._httpd.server_port, timeout=2.0)
+
+
+def test_web_server_endpoints_and_actions(web: tuple[OrbWebServer, OrbWebStatus, dict]) -> None:
+    server, status, calls = web
+    # Just past the 80-character summary limit so the truncation path runs.
+    transcript = "hello hello hello world " + "x" * 81
+    status.apply(state=OrbState.PROCESSING, ambient_running=True, last_transcript=transcript, last_reply="hi there")
+
+    # Routing is exercised in-process; the keep-alive test below covers the socket path.
+    health = _json_request(server, "/health")
+    assert health == {
+        "ok": True,
+        "ambient_running": True,
+        "last_error": None,
+    }
+
+    state = _json_request(server, "/state")
+    assert state["state"] == "processing"
+    assert state["dry_run"] is True
+    assert state["simulation_enabled"] is False
+    preview, _, chars = state["last_transcript_summary"].partition(" (chars=")
+    assert preview.startswith("hello hello") and preview.endswith("…")
+    assert chars == f"{len(transcript)})"
+    assert state["last_reply_summary"] == "hi there (chars=8)"
+
+    trigger = _json_request(server, "/actions/trigger", method="POST", payload={})
+    assert trigger == {"triggered": True}
+    assert calls["trigger"] == 1
+
+    reset = _json_request(server, "/actions/reset", method="POST", payload={})
+    assert reset == {"reset": True}
+    assert calls["reset"] == 1
+
+    simulation = _json_request(server, "/actions/simulation", method="POST", payload={"enabled": True})
+    assert simulation == {"simulation_enabled": True}
+    assert calls["simulation"] is True
+
+    assert server.dispatch("POST", "/actions/simulation", b"{")[0] == HTTPStatus.BAD_REQUEST
+    assert server.dispatch("GET", "/actions/trigger")[0] == HTTPStatus.NOT_FOUND
+
+
+def test_web_server_reuses_keep_alive_connection(web: tuple[OrbWebServer, OrbWebStatus, dict]) -> None:
+    server, _status, calls = web
+    conn = _connect(server)
 
     try:
-        health = _json_request(f"{base}/health")
-        assert health == {
-            "ok": True,
-            "ambient_running": True,
-            "last_error": None,
-        }
-
-        state = _json_request(f"{base}/state")
-        assert state["state"] == "processing"
-        assert state["dry_run"] is True
-        assert state["simulation_enabled"] is False
-        assert "chars=" in state["last_transcript_summary"]
-        assert "hello hello" in state["last_transcript_summary"]
-        assert "hi there" in state["last_reply_summary"]
-
-        trigger = _json_request(f"{base}/actions/trigger", method="POST", payload={})
-        assert trigger == {"triggered": True}
+        for _ in range(3):
+            conn.request("GET", "/state")
+            response = conn.getresponse()
+            assert response.version == 11
+            assert json.loads(response.read())["state"] == "ambient"
+            assert response.will_close is False
+        # A POST body left unread would be parsed as the next request on this connection.
+        conn.request("POST", "/actions/trigger", body=b"{}")
+        response = conn.getresponse()
+        assert response.status == 200
+        response.read()
         assert calls["trigger"] == 1
+        conn.request("GET", "/health")
+        response = conn.getresponse()
+        assert response.status == 200
+        assert json.loads(response.read())["ok"] is True
+        conn.request("GET", "/missing")
+        response = conn.getresponse()
+        assert response.status == 404
+        response.read()
+    finally:
+        conn.close()
 
-        reset = _json_request(f"{base}/actions/reset", method="POST", payload={})
-        assert reset == {"reset": True}
-        assert calls["reset"] == 1
 
-        simulation = _json_request(f"{base}/actions/simulation", method="POST", payload={"enabled": True})
-        assert simulation == {"simulation_enabled": True}
-        assert calls["simulation"] is True
+def test_web_server_serves_actions_while_dashboards_hold_connections(
+    web: tuple[OrbWebServer, OrbWebStatus, dict],
+) -> None:
+    server, _status, calls = web
+    # More open keep-alive pollers than a browser keeps per host must not starve an action.
+    pollers = [_connect(server) for _ in range(8)]
+    conn = _connect(server)
+    try:
+        for poller in pollers:
+            poller.request("GET", "/state")
+            poller.getresponse().read()
+        conn.request("POST", "/actions/trigger")
+        assert conn.getresponse().status == 200
+        assert calls["trigger"] == 1
     finally:
-        server.stop()
+        conn.close()
+        for poller in pollers:
+            poller.close()
 
 
 def test_web_status_snapshot_mapping() -> None:
     status = OrbWebStatus(dry_run=False)
-    status.set_state(OrbState.ERROR)
-    status.set_ambient_running(False)
-    status.set_simulation_enabled(True)
-    status.set_last_error("boom")
+    status.apply(state=OrbState.ERROR, ambient_running=False, simulation_enabled=True, last_error="boom")
 
     snapshot = status.snapshot()
 
@@ -86,3 +160,34 @@ def test_web_status_snapshot_mapping() -> None:
     assert snapshot.dry_run is False
     assert snapshot.simulation_enabled is True
     assert snapshot.last_error == "boom"
+
+    status.apply(last_transcript="hi")
+    status.apply(last_transcript=None, last_error=None)
+    assert status.snapshot().last_transcript_summary is None
+    assert status.snapshot().last_error is None
+
+    with pytest.raises(TypeError, match="dry_run"):
+        status.apply(dry_run=True)
+
+
+def test_web_status_json_cache_is_reused_until_a_setter_runs() -> None:
+    status = OrbWebStatus(dry_run=True)
+
+    first = status.state_json()
+    assert status.state_json() is first
+    assert json.loads(status.health_json()) == {"ok": True, "ambient_running": False, "last_error": None}
+
+    status.set_state(OrbState.LISTENING)
+    status.set_last_error("boom")
+
+    assert json.loads(status.state_json())["state"] == "listening"
+    assert json.loads(status.health_json())["ok"] is False
+
+
+def test_summarize_text_bounds_long_input() -> None:
+    long_text = "word  " * 10_000
+
+    summary = OrbWebStatus._summarize_text(long_text)
+
+    assert summary == f"{'word ' * 16}… (chars={len(long_text)})"
+    assert OrbWebStatus._summarize_text(" hi\n there ") == "hi there (chars=11)"